@@ -0,0 +1,36 @@
+"""Flask JSON provider backed by ``orjson``.
+
+``jsonify`` responses are encoded with orjson instead of the stdlib ``json``
+module. Output matches Flask's default provider where clients could notice:
+keys are sorted, non-string keys are stringified, and dates still go through
+Flask's ``http_date`` formatting.
+"""
+from __future__ import annotations
+
+from typing import Any
+
+import orjson
+from flask import Response
+from flask.json.provider import DefaultJSONProvider
+
+_BASE_OPTIONS = (
+    orjson.OPT_SORT_KEYS
+    | orjson.OPT_NON_STR_KEYS
+    | orjson.OPT_PASSTHROUGH_DATETIME
+    | orjson.OPT_APPEND_NEWLINE
+)
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Serialise ``jsonify`` payloads with orjson."""
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        obj = self._prepare_response_obj(args, kwargs)
+        options = _BASE_OPTIONS
+        if (self.compact is None and self._app.debug) or self.compact is False:
+            options |= orjson.OPT_INDENT_2
+        body = orjson.dumps(obj, default=self.default, option=options)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+
+__all__ = ["OrjsonProvider"]
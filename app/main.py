@@ -1,30 +1,47 @@
 from __future__ import annotations
 
 import csv
+import gzip
+import hashlib
+import hmac
 import io
+import math
+import mimetypes
 import os
+import queue
 import threading
 import time
-from typing import Any, Dict, Generator
-
+import unicodedata
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, Generator, Iterable, Iterator
+from urllib.parse import quote
+
+import orjson
 from flask import (
     Flask,
     Response,
     flash,
     jsonify,
+    make_response,
     redirect,
     render_template,
     request,
     send_file,
     send_from_directory,
+    session,
     url_for,
 )
 
+from app.json_provider import OrjsonProvider
 from app.scraper import config, db, db_reporting, sources
 from app.scraper.download_rows import build_download_rows, load_download_records
 from app.scraper.run import run_scrape
 from app.scraper.config_validation import validate_runtime_config
-from app.scraper.healthcheck import run_health_checks
+from app.scraper.healthcheck import HealthResult, run_health_checks
 from app.scraper.export_excel import export_latest_run_to_excel
 from app.scraper.utils import (
     build_zip,
@@ -38,10 +55,17 @@ from app.scraper.utils import (
     reset_state,
     save_base_url,
 )
+from app.scraper.log_watch import LogBroadcaster
 from app.scraper.logging_utils import _scraper_event
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 app.secret_key = os.environ.get("SECRET_KEY", "dev-secret-change-me")
+# Behind Apache/lighttpd, let the front-end send file bodies via X-Sendfile.
+app.config["USE_X_SENDFILE"] = config.USE_X_SENDFILE
+# Compile the page templates now rather than on each worker's first request.
+for _template_name in ("index.html", "report.html"):
+    app.jinja_env.get_template(_template_name)
 
 # Initialise storage paths and SQLite schema on import so WSGI/ASGI entrypoints
 # also have the expected environment ready. Idempotent by design.
@@ -51,6 +75,90 @@ db.initialize_schema()
 WEBHOOK_LIMIT_MAX = max(1, config.WEBHOOK_NEW_LIMIT_MAX)
 WEBHOOK_DEFAULT_NEW_LIMIT = min(config.SCRAPE_NEW_LIMIT, WEBHOOK_LIMIT_MAX)
 
+_CSV_FIELDNAMES = (
+    "fid",
+    "slug",
+    "title",
+    "subject",
+    "category",
+    "court",
+    "cause_number",
+    "judgment_date",
+    "downloaded_at",
+    "local_filename",
+    "source_url",
+    "filesize",
+)
+_CSV_DEFAULTS = ("",) * len(_CSV_FIELDNAMES)
+_CSV_CHUNK_CHARS = 64 * 1024
+
+# Home page form defaults: (template variable, LAST_PARAMS key, config
+# attribute). Config is read per request so runtime overrides still apply.
+_INDEX_CONFIG_DEFAULTS = (
+    ("default_wait", "page_wait", "PAGE_WAIT_SECONDS"),
+    ("default_new_limit", "new_limit", "SCRAPE_NEW_LIMIT"),
+    ("default_delay", "per_download_delay", "PER_DOWNLOAD_DELAY"),
+    ("default_mode", "scrape_mode", "SCRAPE_MODE_DEFAULT"),
+    ("default_target_source", "target_source", "DEFAULT_SOURCE"),
+)
+# (template variable, LAST_PARAMS key, fixed default)
+_INDEX_FIXED_DEFAULTS = (
+    ("default_resume_mode", "resume_mode", "none"),
+    ("default_resume_page", "resume_page", None),
+    ("default_resume_index", "resume_index", None),
+    ("default_reset_before_run", "reset_before_run", False),
+    ("default_reset_delete_pdfs", "reset_delete_pdfs", False),
+)
+
+_SSE_HEARTBEAT_SECONDS = 30.0
+_SSE_MAX_LINES_PER_EVENT = 64
+_LOG_ROTATION_CHECK_SECONDS = 5.0
+_LOG_BROADCASTER = LogBroadcaster(
+    get_current_log_path, rotation_check_seconds=_LOG_ROTATION_CHECK_SECONDS
+)
+
+# Scrapes are inherently single-run, so UI submissions share one worker.
+_SCRAPE_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="scrape")
+_SCRAPE_FUTURE: Future[None] | None = None
+_SCRAPE_LOCK = threading.Lock()
+# Held for the duration of a (synchronous) webhook-triggered scrape.
+_WEBHOOK_SCRAPE_LOCK = threading.Lock()
+
+_GZIP_METADATA_CACHE: dict[tuple[str, str, str], bytes] = {}
+# Parsed metadata and its identity JSON encoding, for the current file state.
+_METADATA_CACHE: dict[tuple[str, str], dict[str, Any]] = {}
+_METADATA_JSON_CACHE: dict[tuple[str, str], bytes] = {}
+
+# Buffered HTML/JSON/CSV bodies at least this large are gzipped on the way out.
+_COMPRESSIBLE_MIMETYPES = frozenset({"text/html", "application/json", "text/csv"})
+_COMPRESS_MIN_BYTES = 1024
+
+_LOG_TAIL_BLOCK_BYTES = 8 * 1024
+_LOG_TAIL_CACHE: dict[tuple[str, int, int, int], list[str]] = {}
+
+# Mixed into state-derived ETags so a restart (and possibly new templates or
+# code) never revalidates against a previous process's responses.
+_ETAG_SALT = f"{os.getpid()}-{time.time_ns()}"
+
+_DOWNLOADED_CASES_CACHE: dict[tuple[tuple[object, ...], str | None], bytes] = {}
+# Largest page served when ``/api/downloaded-cases`` is called with ``limit``.
+_DOWNLOADED_CASES_PAGE_MAX = 1000
+
+_INDEX_PAGE_CACHE: dict[str, str] = {}
+
+_REPORT_FACETS_CACHE: dict[tuple[object, ...], dict[str, Any]] = {}
+
+_REPORT_VIEW_CACHE: dict[
+    tuple[str, int, int], tuple[list[dict[str, object]], list[str], list[str]]
+] = {}
+
+# Health results are shared for this long; concurrent probes wait on the
+# single check already in flight instead of starting their own.
+_HEALTH_CACHE_SECONDS = 2.0
+_HEALTH_LOCK = threading.Lock()
+_HEALTH_STATE: tuple[float, HealthResult] | None = None
+_HEALTH_PENDING: "Future[HealthResult] | None" = None
+
 
 def use_db_reporting() -> bool:
     """Return True when DB-backed reporting endpoints should be used."""
@@ -58,76 +166,383 @@ def use_db_reporting() -> bool:
     return config.use_db_reporting()
 
 
+def _tail_lines(fd: int, size: int, limit: int) -> list[bytes]:
+    """Return up to ``limit`` trailing lines of ``fd`` by reading backwards.
+
+    Blocks of ``_LOG_TAIL_BLOCK_BYTES`` are read from the end of the file
+    until enough newlines have been seen, so the cost tracks ``limit`` rather
+    than the size of the log.
+    """
+
+    blocks: list[bytes] = []
+    newlines = 0
+    position = size
+    while position > 0 and newlines <= limit:
+        step = min(_LOG_TAIL_BLOCK_BYTES, position)
+        position -= step
+        block = os.pread(fd, step, position)
+        blocks.append(block)
+        newlines += block.count(b"\n")
+
+    raw_lines = b"".join(reversed(blocks)).split(b"\n")
+    if position:
+        # The first line read is probably cut mid-way.
+        raw_lines = raw_lines[1:]
+    if raw_lines and not raw_lines[-1]:
+        raw_lines.pop()
+    return raw_lines[-limit:]
+
+
 def _read_last_log_lines(limit: int = 150) -> list[str]:
-    """Return the trailing ``limit`` log lines for initial display."""
+    """Return the trailing ``limit`` log lines for initial display.
+
+    The result is reused until the log's mtime or size changes.
+    """
 
     ensure_dirs()
     path = get_current_log_path()
-    if not path.exists():
+    try:
+        with path.open("rb") as handle:
+            stat = os.fstat(handle.fileno())
+            key = (str(path), stat.st_mtime_ns, stat.st_size, limit)
+            cached = _LOG_TAIL_CACHE.get(key)
+            if cached is not None:
+                return list(cached)
+            raw_lines = _tail_lines(handle.fileno(), stat.st_size, limit)
+    except OSError:
         return []
 
-    with path.open("r", encoding="utf-8", errors="ignore") as handle:
-        lines = handle.readlines()[-limit:]
-    return [line.rstrip("\n") for line in lines]
+    lines = [raw.decode("utf-8", errors="ignore").rstrip("\r") for raw in raw_lines]
+
+    _LOG_TAIL_CACHE.clear()
+    _LOG_TAIL_CACHE[key] = lines
+    return list(lines)
+
+
+def _sse_events(lines: list[str]) -> str:
+    """Encode ``lines`` as SSE messages of up to ``_SSE_MAX_LINES_PER_EVENT``.
+
+    Each message carries one ``data:`` field per line; browsers join them
+    with newlines, so a client appending ``event.data`` sees the same text.
+    """
+
+    events = []
+    for start in range(0, len(lines), _SSE_MAX_LINES_PER_EVENT):
+        chunk = lines[start : start + _SSE_MAX_LINES_PER_EVENT]
+        events.append("".join(f"data: {line.rstrip()}\n" for line in chunk) + "\n")
+    return "".join(events)
 
 
 def _tail_log_generator() -> Generator[str, None, None]:
     """Yield Server-Sent Event messages for appended log lines."""
 
     ensure_dirs()
-    current_path = get_current_log_path()
-    current_path.parent.mkdir(parents=True, exist_ok=True)
-    current_path.touch(exist_ok=True)
-
-    handle = current_path.open("r", encoding="utf-8", errors="ignore")
-    handle.seek(0, os.SEEK_END)
-
+    subscription = _LOG_BROADCASTER.subscribe()
     try:
         while True:
-            latest_path = get_current_log_path()
-            if latest_path != current_path:
-                handle.close()
-                current_path = latest_path
-                current_path.parent.mkdir(parents=True, exist_ok=True)
-                current_path.touch(exist_ok=True)
-                handle = current_path.open("r", encoding="utf-8", errors="ignore")
-                handle.seek(0, os.SEEK_END)
-
-            line = handle.readline()
-            if line:
-                yield f"data: {line.rstrip()}\n\n"
-            else:
-                time.sleep(1)
+            try:
+                lines = subscription.get(timeout=_SSE_HEARTBEAT_SECONDS)
+            except queue.Empty:
                 yield ": heartbeat\n\n"
+                continue
+            # Coalesce every batch already queued into a single write.
+            while True:
+                try:
+                    lines = lines + subscription.get_nowait()
+                except queue.Empty:
+                    break
+            yield _sse_events(lines)
     finally:
-        handle.close()
-
-
-def _metadata_to_csv(meta: dict) -> str:
-    """Serialise the metadata dictionary to a CSV string."""
-
-    output = io.StringIO()
-    fieldnames = [
-        "fid",
-        "slug",
-        "title",
-        "subject",
-        "category",
-        "court",
-        "cause_number",
-        "judgment_date",
-        "downloaded_at",
-        "local_filename",
-        "source_url",
-        "filesize",
-    ]
-    writer = csv.DictWriter(output, fieldnames=fieldnames)
-    writer.writeheader()
+        _LOG_BROADCASTER.unsubscribe(subscription)
+
+
+def _metadata_csv_rows(meta: dict) -> Iterator[Iterable[object]]:
+    """Yield CSV row values for each download entry, in field order."""
+
     for entry in meta.get("downloads", []):
-        if not isinstance(entry, dict):
-            continue
-        writer.writerow({key: entry.get(key, "") for key in fieldnames})
-    return output.getvalue()
+        if isinstance(entry, dict):
+            yield map(entry.get, _CSV_FIELDNAMES, _CSV_DEFAULTS)
+
+
+def _iter_metadata_csv(meta: dict) -> Generator[str, None, None]:
+    """Yield the metadata dictionary as CSV text in ``_CSV_CHUNK_CHARS`` pieces.
+
+    The header goes out on its own so the response starts immediately; rows
+    are then buffered into larger chunks to keep the number of writes down.
+    """
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(_CSV_FIELDNAMES)
+    yield buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate(0)
+
+    for row in _metadata_csv_rows(meta):
+        writer.writerow(row)
+        if buffer.tell() >= _CSV_CHUNK_CHARS:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def _metadata_csv_path() -> Path:
+    """Return the pre-rendered CSV export stored next to ``metadata.json``."""
+
+    return config.METADATA_FILE.with_suffix(".csv")
+
+
+def _refresh_metadata_csv() -> None:
+    """Render ``metadata.csv`` from the current metadata, off the request path.
+
+    The file is stamped with the mtime of the ``metadata.json`` it was built
+    from, so ``export_csv`` can tell whether it is still current.
+    """
+
+    try:
+        source_stat = config.METADATA_FILE.stat()
+    except OSError:
+        return
+    target = _metadata_csv_path()
+    tmp_path = target.with_suffix(".csv.tmp")
+    try:
+        with tmp_path.open("w", encoding="utf-8", newline="") as handle:
+            handle.writelines(_iter_metadata_csv(load_metadata()))
+        os.utime(tmp_path, ns=(source_stat.st_atime_ns, source_stat.st_mtime_ns))
+        tmp_path.replace(target)
+    except OSError as exc:
+        log_line(f"Failed to write metadata CSV export: {exc}")
+
+
+def _fresh_metadata_csv() -> Path | None:
+    """Return the pre-rendered CSV when it matches ``metadata.json``."""
+
+    target = _metadata_csv_path()
+    try:
+        current = config.METADATA_FILE.stat().st_mtime_ns
+        rendered = target.stat().st_mtime_ns
+    except OSError:
+        return None
+    return target if rendered == current else None
+
+
+def _metadata_validators() -> tuple[str, datetime] | None:
+    """Return an ETag and Last-Modified pair for ``metadata.json``."""
+
+    ensure_dirs()
+    try:
+        stat = config.METADATA_FILE.stat()
+    except OSError:
+        return None
+    etag = f"{stat.st_mtime_ns:x}-{stat.st_size:x}"
+    return etag, datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc)
+
+
+def _cached_metadata(etag: str | None) -> dict[str, Any]:
+    """Return parsed ``metadata.json``, re-reading it only when ``etag`` changes.
+
+    The dict is shared between requests and must be treated as read-only.
+    """
+
+    if etag is None:
+        return load_metadata()
+    key = (str(config.METADATA_FILE), etag)
+    meta = _METADATA_CACHE.get(key)
+    if meta is None:
+        meta = load_metadata()
+        _METADATA_CACHE.clear()
+        _METADATA_CACHE[key] = meta
+    return meta
+
+
+def _metadata_json(etag: str | None) -> bytes:
+    """Return the ``/api/metadata`` body, encoded once per metadata state."""
+
+    if etag is None:
+        return orjson.dumps(load_metadata())
+    key = (str(config.METADATA_FILE), etag)
+    body = _METADATA_JSON_CACHE.get(key)
+    if body is None:
+        body = orjson.dumps(_cached_metadata(etag))
+        _METADATA_JSON_CACHE.clear()
+        _METADATA_JSON_CACHE[key] = body
+    return body
+
+
+def _is_not_modified(validators: tuple[str, datetime] | None) -> bool:
+    """Return True when the request's conditional headers match ``validators``."""
+
+    if validators is None:
+        return False
+    etag, last_modified = validators
+    if request.if_none_match:
+        return request.if_none_match.contains_weak(etag)
+    if request.if_modified_since is not None:
+        return last_modified.replace(microsecond=0) <= request.if_modified_since
+    return False
+
+
+def _with_validators(
+    response: Response, validators: tuple[str, datetime] | None
+) -> Response:
+    """Attach weak ETag and Last-Modified headers to ``response``.
+
+    ``no-cache`` stops browsers from heuristically reusing the body based on
+    Last-Modified; every reuse is revalidated, which is answered with a 304.
+    """
+
+    if validators is not None:
+        etag, last_modified = validators
+        response.set_etag(etag, weak=True)
+        response.last_modified = last_modified
+    response.cache_control.no_cache = True
+    return response
+
+
+def _accepts_gzip() -> bool:
+    """Return True when the client accepts a gzip content coding."""
+
+    return request.accept_encodings["gzip"] > 0
+
+
+def _gzipped_metadata(
+    kind: str, etag: str, render: Callable[[dict[str, Any]], Iterable[bytes]]
+) -> bytes:
+    """Return gzip-compressed ``render(metadata)`` output, cached per ETag.
+
+    Chunks from ``render`` are compressed as they are produced, so the
+    uncompressed body is never held in memory as a whole.
+    """
+
+    key = (str(config.METADATA_FILE), etag, kind)
+    cached = _GZIP_METADATA_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    compressed = io.BytesIO()
+    with gzip.GzipFile(fileobj=compressed, mode="wb", compresslevel=6) as gz:
+        for chunk in render(_cached_metadata(etag)):
+            gz.write(chunk)
+    body = compressed.getvalue()
+    # Snapshot the keys: other request threads may be filling the cache.
+    stale = [k for k in list(_GZIP_METADATA_CACHE) if k[:2] != key[:2]]
+    for stale_key in stale:
+        _GZIP_METADATA_CACHE.pop(stale_key, None)
+    _GZIP_METADATA_CACHE[key] = body
+    return body
+
+
+def _mark_gzipped(response: Response) -> Response:
+    """Label ``response`` as carrying a gzip-encoded body."""
+
+    response.headers["Content-Encoding"] = "gzip"
+    response.vary.add("Accept-Encoding")
+    return response
+
+
+@app.after_request
+def _compress_response(response: Response) -> Response:
+    """Gzip buffered HTML, JSON and CSV bodies for clients that accept it.
+
+    Level 1 keeps the CPU cost low while still shrinking the repetitive
+    markup and tabular payloads several times over. Streamed, file-backed, already
+    encoded and small responses are passed through untouched.
+    """
+
+    if response.mimetype not in _COMPRESSIBLE_MIMETYPES:
+        return response
+    response.vary.add("Accept-Encoding")
+    if (
+        response.status_code != 200
+        or response.direct_passthrough
+        or response.is_streamed
+        or "Content-Encoding" in response.headers
+        or not _accepts_gzip()
+    ):
+        return response
+
+    body = response.get_data()
+    if len(body) < _COMPRESS_MIN_BYTES:
+        return response
+    response.set_data(gzip.compress(body, compresslevel=1))
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        # The encoded bytes differ from the identity representation.
+        response.set_etag(etag, weak=True)
+    return _mark_gzipped(response)
+
+
+@lru_cache(maxsize=16)
+def _resolved_root(root: Path) -> Path:
+    """Return ``root.resolve()``, memoised per configured directory."""
+
+    return root.resolve()
+
+
+def _contained_path(root: Path, filename: str) -> Path | None:
+    """Return ``root / filename`` resolved, or None if it escapes ``root``.
+
+    Absolute paths and ``..`` segments are refused before touching the
+    filesystem; the target is still resolved so a symlink inside ``root``
+    cannot point outside it.
+    """
+
+    relative = Path(filename)
+    if relative.is_absolute() or ".." in relative.parts:
+        return None
+    target = (root / relative).resolve()
+    if not target.is_relative_to(_resolved_root(root)):
+        return None
+    return target
+
+
+def _send_data_file(path: Path, download_name: str) -> Response:
+    """Send ``path`` as an attachment, delegating to nginx when configured.
+
+    With ``config.X_ACCEL_REDIRECT_PREFIX`` set, files under ``DATA_DIR`` are
+    answered with an empty ``X-Accel-Redirect`` response so the proxy serves
+    the bytes itself. Otherwise Flask's ``send_file`` handles the file, which
+    emits ``X-Sendfile`` instead of a body when ``USE_X_SENDFILE`` is on.
+    """
+
+    prefix = config.X_ACCEL_REDIRECT_PREFIX
+    data_root = _resolved_root(config.DATA_DIR)
+    resolved = path.resolve() if prefix else None
+    if resolved is None or not resolved.is_relative_to(data_root):
+        # Conditional so repeat downloads of an unchanged file (notably the
+        # reused all.zip) are answered with a bodiless 304.
+        return send_file(
+            path,
+            as_attachment=True,
+            download_name=download_name,
+            conditional=True,
+            etag=True,
+        )
+
+    relative = resolved.relative_to(data_root).as_posix()
+    response = Response(mimetype=mimetypes.guess_type(download_name)[0])
+    response.headers["X-Accel-Redirect"] = f"{prefix}/{quote(relative)}"
+    try:
+        download_name.encode("ascii")
+    except UnicodeEncodeError:
+        fallback = (
+            unicodedata.normalize("NFKD", download_name)
+            .encode("ascii", "ignore")
+            .decode("ascii")
+        )
+        response.headers.set(
+            "Content-Disposition",
+            "attachment",
+            filename=fallback,
+            **{"filename*": f"UTF-8''{quote(download_name, safe='')}"},
+        )
+    else:
+        response.headers.set(
+            "Content-Disposition", "attachment", filename=download_name
+        )
+    return response
 
 
 def _load_download_records() -> list[dict[str, object]]:
@@ -136,19 +551,177 @@ def _load_download_records() -> list[dict[str, object]]:
     return load_download_records()
 
 
+def _download_facets(rows: list[dict[str, object]]) -> tuple[list[str], list[str]]:
+    """Return the sorted distinct courts and categories present in ``rows``."""
+
+    courts: set[str] = set()
+    categories: set[str] = set()
+    for row in rows:
+        court = row["court"]
+        if court:
+            courts.add(court)
+        category = row["category"]
+        if category:
+            categories.add(category)
+    return sorted(courts), sorted(categories)
+
+
+def _stat_key(path: Path) -> tuple[str, int, int] | None:
+    """Return ``(path, mtime_ns, size)`` for ``path``, or None if missing."""
+
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return str(path), stat.st_mtime_ns, stat.st_size
+
+
+def _downloads_log_key() -> tuple[str, int, int] | None:
+    """Return a cache key describing the current ``downloads.jsonl`` state."""
+
+    return _stat_key(config.DOWNLOADS_LOG)
+
+
+def _report_data_version() -> tuple[object, ...]:
+    """Return a token that changes whenever the UI download rows may change."""
+
+    if use_db_reporting():
+        return ("db", db.data_version())
+    return ("jsonl", _downloads_log_key())
+
+
+def _state_etag(*parts: object) -> str:
+    """Hash ``parts`` into a short ETag, scoped to this process's code."""
+
+    payload = repr((_ETAG_SALT, parts)).encode("utf-8")
+    return hashlib.blake2b(payload, digest_size=8).hexdigest()
+
+
+def _report_etag() -> str | None:
+    """Return an ETag for ``/report``, or None when it must be rendered fresh."""
+
+    if session.get("_flashes"):
+        return None
+    return _state_etag(
+        "report",
+        _report_data_version(),
+        _stat_key(get_current_log_path()),
+        _stat_key(config.SUMMARY_FILE),
+        _stat_key(config.CONFIG_FILE),
+        app.config.get("LAST_SUMMARY"),
+        app.config.get("LAST_PARAMS"),
+    )
+
+
+def _not_modified(etag: str, *, weak: bool = False) -> Response:
+    """Return an empty 304 response carrying ``etag``."""
+
+    response = Response(status=304)
+    response.set_etag(etag, weak=weak)
+    response.cache_control.no_cache = True
+    return response
+
+
+def _revalidated(response: Response, etag: str) -> Response:
+    """Attach a weak ``etag`` and require clients to revalidate before reuse."""
+
+    response.set_etag(etag, weak=True)
+    response.cache_control.no_cache = True
+    return response
+
+
+def _json_report_view() -> tuple[list[dict[str, object]], list[str], list[str]]:
+    """Return JSONL-backed rows, courts, and categories.
+
+    The derived view is cached against the log file's mtime and size so repeat
+    renders skip re-parsing the log while it is unchanged.
+    """
+
+    key = _downloads_log_key()
+    cached = _REPORT_VIEW_CACHE.get(key) if key else None
+    if cached is not None:
+        return cached
+
+    rows = build_download_rows(_load_download_records())
+    courts, categories = _download_facets(rows)
+    view = (rows, courts, categories)
+    _REPORT_VIEW_CACHE.clear()
+    if key:
+        _REPORT_VIEW_CACHE[key] = view
+    return view
+
+
+def _db_report_facets() -> dict[str, Any]:
+    """Return the DB download count, courts and categories for ``/report``.
+
+    Cached against ``db.data_version()`` so renders between scrapes skip the
+    aggregate queries entirely.
+    """
+
+    version = db.data_version()
+    cached = _REPORT_FACETS_CACHE.get(version)
+    if cached is not None:
+        return cached
+
+    facets = db_reporting.get_download_facets_for_run(status_filter="downloaded")
+    _REPORT_FACETS_CACHE.clear()
+    _REPORT_FACETS_CACHE[version] = facets
+    return facets
+
+
+def _downloaded_cases_body(source: str | None, version: tuple[object, ...]) -> bytes:
+    """Return the encoded ``/api/downloaded-cases`` payload for ``source``.
+
+    Bodies are cached against the data version token, so polling clients
+    share one query and one JSON encoding until the downloads change.
+    """
+
+    key = (version, source)
+    body = _DOWNLOADED_CASES_CACHE.get(key)
+    if body is not None:
+        return body
+
+    rows = _get_download_rows_for_ui(source=source)
+    body = app.json.response({"data": rows}).get_data()
+    # Snapshot the keys: other request threads may be filling the cache.
+    for stale_key in [k for k in list(_DOWNLOADED_CASES_CACHE) if k[0] != version]:
+        _DOWNLOADED_CASES_CACHE.pop(stale_key, None)
+    _DOWNLOADED_CASES_CACHE[key] = body
+    return body
+
+
+def _iter_downloaded_cases_page(
+    pairs: Iterable[tuple[int, dict[str, object]]], limit: int
+) -> Iterator[bytes]:
+    """Encode one page of ``/api/downloaded-cases`` rows as they are fetched.
+
+    ``next_after_id`` carries the cursor for the following page, or ``null``
+    once fewer than ``limit`` rows were left.
+    """
+
+    yield b'{"data":['
+    count = 0
+    last_id: int | None = None
+    for download_id, row in pairs:
+        yield (b"," if count else b"") + orjson.dumps(row)
+        count += 1
+        last_id = download_id
+    next_after_id = last_id if count >= limit else None
+    yield b'],"next_after_id":' + orjson.dumps(next_after_id) + b"}"
+
+
 def _get_download_rows_for_ui(source: str | None = None) -> list[dict[str, object]]:
     """Return download rows for the UI (report + JSON API)."""
 
     normalized_source = sources.coerce_source(source) if source else None
 
     if use_db_reporting():
-        rows_from_db = db_reporting.get_download_rows_for_run(
+        # Already plain dicts built per row by db_reporting; no copy needed.
+        return db_reporting.get_download_rows_for_run(
             status_filter="downloaded", source=normalized_source
         )
-        return [dict(row) for row in rows_from_db]
 
-    records = _load_download_records()
-    rows = build_download_rows(records)
+    rows = _json_report_view()[0]
     if normalized_source:
         return [row for row in rows if row.get("source") == normalized_source]
     return rows
@@ -161,14 +734,32 @@ def _get_webhook_token() -> str | None:
     return token
 
 
+def _webhook_token_matches(token: str | None) -> bool:
+    """Compare ``token`` with the shared secret in constant time."""
+
+    if not token:
+        return False
+    # compare_digest rejects non-ASCII str, so compare the UTF-8 bytes.
+    return hmac.compare_digest(
+        token.encode("utf-8"), config.WEBHOOK_SHARED_SECRET.encode("utf-8")
+    )
+
+
 def _parse_webhook_payload() -> dict[str, object]:
-    payload: dict[str, object] = {}
-    payload.update(request.args or {})
+    """Merge query arguments with the JSON or form body; the body wins."""
+
+    payload: dict[str, object] = request.args.to_dict()
 
     if request.is_json:
-        payload.update(request.get_json(silent=True) or {})
+        body = request.get_data(cache=False)
+        try:
+            data = orjson.loads(body) if body else None
+        except orjson.JSONDecodeError:
+            data = None
+        if isinstance(data, dict):
+            payload.update(data)
     else:
-        payload.update(request.form or {})
+        payload.update(request.form.to_dict())
 
     return payload
 
@@ -190,67 +781,181 @@ def inject_globals() -> dict[str, object]:
 
 
 @app.route("/")
-def index() -> str:
-    """Render the home page with scrape configuration controls."""
+def index() -> Response:
+    """Render the home page with scrape configuration controls.
+
+    The page depends only on the context built below, so it is rendered once
+    per distinct context and revalidated by an ETag derived from it.
+    """
 
     ensure_dirs()
-    last_summary = app.config.get("LAST_SUMMARY")
     last_params = app.config.get("LAST_PARAMS", {})
-    context = {
-        "default_base_url": load_base_url(),
-        "default_wait": last_params.get("page_wait", config.PAGE_WAIT_SECONDS),
-        "default_new_limit": last_params.get("new_limit", config.SCRAPE_NEW_LIMIT),
-        "default_delay": last_params.get(
-            "per_download_delay", config.PER_DOWNLOAD_DELAY
-        ),
-        "default_mode": last_params.get(
-            "scrape_mode", config.SCRAPE_MODE_DEFAULT
-        ),
-        "default_resume_mode": last_params.get("resume_mode", "none"),
-        "default_resume_page": last_params.get("resume_page"),
-        "default_resume_index": last_params.get("resume_index"),
-        "default_reset_before_run": last_params.get("reset_before_run", False),
-        "default_reset_delete_pdfs": last_params.get("reset_delete_pdfs", False),
-        "default_target_source": last_params.get("target_source", config.DEFAULT_SOURCE),
-        "available_sources": sources.ALL_SOURCES,
-        "last_summary": last_summary,
+    context: dict[str, object] = {
+        name: last_params.get(key, getattr(config, attr))
+        for name, key, attr in _INDEX_CONFIG_DEFAULTS
     }
-    return render_template("index.html", **context)
+    context.update(
+        (name, last_params.get(key, default))
+        for name, key, default in _INDEX_FIXED_DEFAULTS
+    )
+    context["default_base_url"] = load_base_url()
+    context["available_sources"] = sources.ALL_SOURCES
+    context["last_summary"] = app.config.get("LAST_SUMMARY")
+
+    if session.get("_flashes"):
+        # Pending flash messages are rendered once, so never reuse this page.
+        return make_response(render_template("index.html", **context))
+
+    etag = _state_etag("index", context)
+    if request.if_none_match.contains_weak(etag):
+        return _not_modified(etag, weak=True)
+    page = _INDEX_PAGE_CACHE.get(etag)
+    if page is None:
+        page = render_template("index.html", **context)
+        _INDEX_PAGE_CACHE.clear()
+        _INDEX_PAGE_CACHE[etag] = page
+    return _revalidated(make_response(page), etag)
+
+
+def _scrape_in_progress() -> bool:
+    """Return True while a UI, resume or webhook scrape is still running."""
+
+    if _WEBHOOK_SCRAPE_LOCK.locked():
+        return True
+    return _SCRAPE_FUTURE is not None and not _SCRAPE_FUTURE.done()
+
+
+def _claim_webhook_scrape() -> bool:
+    """Atomically reserve the scrape slot for a synchronous webhook run.
+
+    Returns False without blocking when any scrape is already running. The
+    caller must release ``_WEBHOOK_SCRAPE_LOCK`` once its run has finished.
+    """
+
+    with _SCRAPE_LOCK:
+        if _scrape_in_progress():
+            return False
+        return _WEBHOOK_SCRAPE_LOCK.acquire(blocking=False)
+
+
+def _submit_scrape(
+    job: Callable[[], None], prepare: Callable[[], None] | None = None
+) -> bool:
+    """Run ``prepare`` and queue ``job`` unless a scrape is already running.
+
+    The check, the preparation and the submission all happen under
+    ``_SCRAPE_LOCK`` so two concurrent submissions cannot both get through.
+    """
+
+    global _SCRAPE_FUTURE
+
+    def _job_then_export() -> None:
+        try:
+            job()
+        finally:
+            _refresh_metadata_csv()
+
+    with _SCRAPE_LOCK:
+        if _scrape_in_progress():
+            return False
+        if prepare is not None:
+            prepare()
+        _SCRAPE_FUTURE = _SCRAPE_POOL.submit(_job_then_export)
+    return True
+
+
+def _form_int(name: str, default: int | None) -> int | None:
+    """Return form field ``name`` as an int, or ``default`` if blank or invalid.
+
+    Digits are checked up front so the common blank-field case does not go
+    through ``int()`` raising and catching ``ValueError``.
+    """
+
+    raw = (request.form.get(name) or "").strip()
+    digits = raw[1:] if raw.startswith(("-", "+")) else raw
+    return int(raw) if digits.isdecimal() else default
+
+
+def _form_float(name: str, default: float) -> float:
+    """Return form field ``name`` as a finite float, or ``default``."""
+
+    raw = (request.form.get(name) or "").strip()
+    if not raw:
+        return default
+    try:
+        value = float(raw)
+    except ValueError:
+        return default
+    return value if math.isfinite(value) else default
+
+
+@dataclass(frozen=True)
+class _RunForm:
+    """Fields shared by the ``/scrape`` and ``/resume`` forms."""
+
+    base_url: str
+    page_wait: int
+    per_delay: float
+    resume_mode: str
+    resume_page: int | None
+    resume_index: int | None
+    target_source: str
+
+    def run_kwargs(self) -> dict[str, object]:
+        """Return these fields as ``run_scrape`` keyword arguments."""
+
+        return {
+            "base_url": self.base_url,
+            "page_wait": self.page_wait,
+            "per_delay": self.per_delay,
+            "resume_mode": self.resume_mode,
+            "resume_page": self.resume_page,
+            "resume_index": self.resume_index,
+            "target_source": self.target_source,
+        }
+
+
+def _parse_run_form(*, default_resume_mode: str) -> _RunForm:
+    """Parse the run parameters common to both scrape forms, once per request."""
+
+    form = request.form
+    return _RunForm(
+        base_url=form.get("base_url", config.DEFAULT_BASE_URL).strip(),
+        page_wait=_form_int("page_wait", config.PAGE_WAIT_SECONDS),
+        per_delay=_form_float("per_download_delay", config.PER_DOWNLOAD_DELAY),
+        resume_mode=(
+            form.get("resume_mode", default_resume_mode).strip().lower()
+            or default_resume_mode
+        ),
+        resume_page=_form_int("resume_page", None),
+        resume_index=_form_int("resume_index", None),
+        target_source=sources.coerce_source(form.get("target_source")),
+    )
+
+
+def _scrape_already_running() -> Response:
+    """Flash a warning and send the user back to the report page."""
+
+    flash("A scrape is already running.", "warning")
+    return redirect(url_for("report"))
 
 
 @app.post("/scrape")
 def start_scrape() -> Response:
     """Handle the scrape form submission and trigger a scraping run."""
 
-    base_url = request.form.get("base_url", config.DEFAULT_BASE_URL).strip()
-    page_wait = int(request.form.get("page_wait", config.PAGE_WAIT_SECONDS))
-    per_delay = float(request.form.get("per_download_delay", config.PER_DOWNLOAD_DELAY))
+    if _scrape_in_progress():
+        return _scrape_already_running()
+
+    form = _parse_run_form(default_resume_mode="none")
     scrape_mode = (
         request.form.get("scrape_mode", config.SCRAPE_MODE_DEFAULT).strip().lower()
         or config.SCRAPE_MODE_DEFAULT
     )
-    resume_mode = request.form.get("resume_mode", "none").strip().lower()
-    try:
-        resume_page = int(request.form.get("resume_page"))
-    except (TypeError, ValueError):
-        resume_page = None
-    try:
-        resume_index = int(request.form.get("resume_index"))
-    except (TypeError, ValueError):
-        resume_index = None
     reset_before_run = request.form.get("reset_before_run") == "1"
     delete_pdfs_during_reset = request.form.get("reset_delete_pdfs") == "1"
-    try:
-        new_limit = int(request.form.get("new_limit", config.SCRAPE_NEW_LIMIT))
-    except (TypeError, ValueError):
-        new_limit = config.SCRAPE_NEW_LIMIT
-    new_limit = max(0, new_limit)
-    try:
-        max_retries = int(request.form.get("max_retries", config.SCRAPER_MAX_RETRIES))
-    except (TypeError, ValueError):
-        max_retries = config.SCRAPER_MAX_RETRIES
-    max_retries = max(1, max_retries)
-    target_source = sources.coerce_source(request.form.get("target_source"))
+    new_limit = max(0, _form_int("new_limit", config.SCRAPE_NEW_LIMIT))
+    max_retries = max(1, _form_int("max_retries", config.SCRAPER_MAX_RETRIES))
 
     try:
         validate_runtime_config("ui", mode=scrape_mode)
@@ -259,41 +964,38 @@ def start_scrape() -> Response:
         return redirect(url_for("index")), 400
 
     if reset_before_run:
-        reset_state(delete_pdfs=delete_pdfs_during_reset, delete_logs=False)
         scrape_mode = "full"
 
-    save_base_url(base_url)
-    app.config["LAST_PARAMS"] = {
-        "base_url": base_url,
-        "page_wait": page_wait,
-        "per_download_delay": per_delay,
-        "scrape_mode": scrape_mode,
-        "new_limit": new_limit,
-        "max_retries": max_retries,
-        "reset_before_run": reset_before_run,
-        "reset_delete_pdfs": delete_pdfs_during_reset,
-        "resume_mode": resume_mode,
-        "resume_page": resume_page,
-        "resume_index": resume_index,
-        "target_source": target_source,
-    }
+    def _prepare() -> None:
+        if reset_before_run:
+            reset_state(delete_pdfs=delete_pdfs_during_reset, delete_logs=False)
+
+        save_base_url(form.base_url)
+        app.config["LAST_PARAMS"] = {
+            "base_url": form.base_url,
+            "page_wait": form.page_wait,
+            "per_download_delay": form.per_delay,
+            "scrape_mode": scrape_mode,
+            "new_limit": new_limit,
+            "max_retries": max_retries,
+            "reset_before_run": reset_before_run,
+            "reset_delete_pdfs": delete_pdfs_during_reset,
+            "resume_mode": form.resume_mode,
+            "resume_page": form.resume_page,
+            "resume_index": form.resume_index,
+            "target_source": form.target_source,
+        }
 
     def _run() -> None:
         with app.app_context():
             try:
                 summary = run_scrape(
-                    base_url=base_url,
-                    page_wait=page_wait,
-                    per_delay=per_delay,
+                    **form.run_kwargs(),
                     start_message="Initiating scrape via web UI",
                     scrape_mode=scrape_mode,
                     new_limit=new_limit,
                     max_retries=max_retries,
                     resume=config.SCRAPE_RESUME_DEFAULT,
-                    resume_mode=resume_mode,
-                    resume_page=resume_page,
-                    resume_index=resume_index,
-                    target_source=target_source,
                     trigger="ui",
                 )
                 app.config["LAST_SUMMARY"] = summary
@@ -301,7 +1003,8 @@ def start_scrape() -> Response:
             except Exception as exc:  # noqa: BLE001
                 log_line(f"Scrape thread failed: {exc}")
 
-    threading.Thread(target=_run, daemon=True).start()
+    if not _submit_scrape(_run, prepare=_prepare):
+        return _scrape_already_running()
     flash("Scrape started! Check the Report page in a bit.", "info")
     return redirect(url_for("report"))
 
@@ -310,20 +1013,10 @@ def start_scrape() -> Response:
 def resume_scrape() -> Response:
     """Trigger a resume-aware scrape using stored checkpoints or logs."""
 
-    resume_mode = request.form.get("resume_mode", "auto").strip().lower() or "auto"
-    try:
-        resume_page = int(request.form.get("resume_page"))
-    except (TypeError, ValueError):
-        resume_page = None
-    try:
-        resume_index = int(request.form.get("resume_index"))
-    except (TypeError, ValueError):
-        resume_index = None
+    if _scrape_in_progress():
+        return _scrape_already_running()
 
-    base_url = request.form.get("base_url", config.DEFAULT_BASE_URL).strip()
-    page_wait = int(request.form.get("page_wait", config.PAGE_WAIT_SECONDS))
-    per_delay = float(request.form.get("per_download_delay", config.PER_DOWNLOAD_DELAY))
-    target_source = sources.coerce_source(request.form.get("target_source"))
+    form = _parse_run_form(default_resume_mode="auto")
 
     try:
         validate_runtime_config("ui", mode="resume")
@@ -335,18 +1028,12 @@ def resume_scrape() -> Response:
         with app.app_context():
             try:
                 summary = run_scrape(
-                    base_url=base_url,
-                    page_wait=page_wait,
-                    per_delay=per_delay,
+                    **form.run_kwargs(),
                     start_message="Resume triggered via web UI",
                     scrape_mode=config.SCRAPE_MODE_DEFAULT,
                     new_limit=config.SCRAPE_NEW_LIMIT,
                     max_retries=config.SCRAPER_MAX_RETRIES,
                     resume=True,
-                    resume_mode=resume_mode,
-                    resume_page=resume_page,
-                    resume_index=resume_index,
-                    target_source=target_source,
                     trigger="ui",
                 )
                 app.config["LAST_SUMMARY"] = summary
@@ -354,7 +1041,8 @@ def resume_scrape() -> Response:
             except Exception as exc:  # noqa: BLE001
                 log_line(f"Resume thread failed: {exc}")
 
-    threading.Thread(target=_run, daemon=True).start()
+    if not _submit_scrape(_run):
+        return _scrape_already_running()
     flash("Resume run started!", "info")
     return redirect(url_for("report"))
 
@@ -373,13 +1061,21 @@ def reset_view() -> Response:
 
 
 @app.get("/report")
-def report() -> str:
+def report() -> Response:
     """Render the report page with current metadata and live logs."""
 
     ensure_dirs()
-    downloads = _get_download_rows_for_ui()
-    courts = sorted({row["court"] for row in downloads if row["court"]})
-    categories = sorted({row["category"] for row in downloads if row["category"]})
+    etag = _report_etag()
+    if etag is not None and request.if_none_match.contains_weak(etag):
+        return _not_modified(etag, weak=True)
+
+    if use_db_reporting():
+        facets = _db_report_facets()
+        download_count = facets["count"]
+        courts, categories = facets["courts"], facets["categories"]
+    else:
+        downloads, courts, categories = _json_report_view()
+        download_count = len(downloads)
 
     current_log_path = get_current_log_path()
     summary = load_json_file(config.SUMMARY_FILE)
@@ -389,13 +1085,16 @@ def report() -> str:
         "log_lines": _read_last_log_lines(),
         "last_summary": summary or app.config.get("LAST_SUMMARY"),
         "last_params": app.config.get("LAST_PARAMS", {}),
-        "downloads": downloads,
+        "download_count": download_count,
         "courts": courts,
         "categories": categories,
         "current_log_name": current_log_path.name,
         "available_sources": sources.ALL_SOURCES,
     }
-    return render_template("report.html", **context)
+    response = make_response(render_template("report.html", **context))
+    if etag is not None:
+        response = _revalidated(response, etag)
+    return response
 
 
 @app.get("/logs/stream")
@@ -412,26 +1111,24 @@ def logs_stream() -> Response:
 def download_log(filename: str) -> Response:
     """Serve a log file from the logs directory."""
 
-    target = (config.LOG_DIR / filename).resolve()
-    root = config.LOG_DIR.resolve()
-    if not str(target).startswith(str(root)):
+    target = _contained_path(config.LOG_DIR, filename)
+    if target is None:
         return Response("Invalid path", status=400)
-    if not target.exists() or not target.is_file():
+    if not target.is_file():
         return Response("File not found", status=404)
-    return send_file(target, as_attachment=True, download_name=target.name)
+    return _send_data_file(target, target.name)
 
 
 @app.get("/files/<path:filename>")
 def download_file(filename: str) -> Response:
     """Serve an individual PDF if it exists within the data directory."""
 
-    target = (config.PDF_DIR / filename).resolve()
-    pdf_root = config.PDF_DIR.resolve()
-    if not str(target).startswith(str(pdf_root)):
+    target = _contained_path(config.PDF_DIR, filename)
+    if target is None:
         return Response("Invalid path", status=400)
-    if not target.exists() or not target.is_file():
+    if not target.is_file():
         return Response("File not found", status=404)
-    return send_file(target, as_attachment=True, download_name=target.name)
+    return _send_data_file(target, target.name)
 
 
 @app.get("/download/all.zip")
@@ -439,14 +1136,14 @@ def download_all_zip() -> Response:
     """Create (or refresh) an archive containing all downloaded PDFs."""
 
     archive = build_zip()
-    return send_file(archive, as_attachment=True, download_name=config.ZIP_NAME)
+    return _send_data_file(archive, config.ZIP_NAME)
 @app.post("/webhook/changedetection")
 def webhook_changedetection() -> Response:
     if not config.WEBHOOK_SHARED_SECRET:
         return jsonify({"ok": False, "error": "webhook_disabled"}), 404
 
     token = _get_webhook_token()
-    if token != config.WEBHOOK_SHARED_SECRET:
+    if not _webhook_token_matches(token):
         _scraper_event(
             "error",
             phase="webhook",
@@ -512,6 +1209,16 @@ def webhook_changedetection() -> Response:
         )
         return jsonify({"ok": False, "error": "config_invalid", "details": str(exc)}), 500
 
+    if not _claim_webhook_scrape():
+        _scraper_event(
+            "state",
+            phase="webhook",
+            context="changedetection",
+            kind="scrape_in_progress",
+            remote_addr=request.remote_addr,
+        )
+        return jsonify({"ok": False, "error": "scrape_in_progress"}), 409
+
     _scraper_event(
         "state",
         phase="webhook",
@@ -551,6 +1258,11 @@ def webhook_changedetection() -> Response:
             jsonify({"ok": False, "error": "scrape_error", "error_summary": str(exc)}),
             500,
         )
+    finally:
+        try:
+            _refresh_metadata_csv()
+        finally:
+            _WEBHOOK_SCRAPE_LOCK.release()
 
     summary_counts = {
         "processed": summary.get("processed"),
@@ -579,8 +1291,30 @@ def api_downloaded_cases() -> Response:
     raw_source = request.args.get("source")
     source = sources.coerce_source(raw_source) if raw_source else None
 
-    rows = _get_download_rows_for_ui(source=source)
-    return jsonify({"data": rows})
+    limit = request.args.get("limit", type=int)
+    if limit is not None and use_db_reporting():
+        # Keyset-paged rows are streamed straight from the cursor.
+        limit = max(1, min(limit, _DOWNLOADED_CASES_PAGE_MAX))
+        pairs = db_reporting.iter_download_rows(
+            status_filter="downloaded",
+            source=source,
+            limit=limit,
+            after_id=request.args.get("after_id", type=int),
+        )
+        response = Response(
+            _iter_downloaded_cases_page(pairs, limit), mimetype="application/json"
+        )
+        response.cache_control.no_cache = True
+        return response
+
+    version = _report_data_version()
+    etag = _state_etag("downloaded-cases", source, version)
+    # Weak, so the tag also validates the gzip-encoded representation.
+    if request.if_none_match.contains_weak(etag):
+        return _not_modified(etag, weak=True)
+
+    body = _downloaded_cases_body(source, version)
+    return _revalidated(Response(body, mimetype="application/json"), etag)
 
 
 @app.get("/api/db/runs")
@@ -746,22 +1480,33 @@ def api_db_downloaded_cases() -> Response:
         except ValueError:
             return jsonify({"ok": False, "error": "invalid run_id"}), 400
 
+    etag = _state_etag("db-downloaded-cases", run_id, status, source, db.data_version())
+    if request.if_none_match.contains_weak(etag):
+        return _not_modified(etag, weak=True)
+
     rows = db_reporting.get_download_rows_for_run(
         run_id=run_id, status_filter=status, source=source
     )
-    return jsonify({"data": rows})
+    return _revalidated(jsonify({"data": rows}), etag)
 
 
 @app.get("/api/db/runs/<int:run_id>/downloaded-cases")
 def api_db_downloaded_cases_for_run(run_id: int) -> Response:
     """Return downloaded cases for the given run_id from SQLite."""
 
+    etag = _state_etag("db-run-downloaded-cases", run_id, db.data_version())
+    if request.if_none_match.contains_weak(etag):
+        return _not_modified(etag, weak=True)
+
     try:
         rows = db_reporting.get_downloaded_cases_for_run(run_id)
     except db_reporting.RunNotFoundError:
         return jsonify({"ok": False, "error": "run_not_found", "run_id": run_id}), 404
 
-    return jsonify({"ok": True, "run_id": run_id, "count": len(rows), "downloads": rows})
+    return _revalidated(
+        jsonify({"ok": True, "run_id": run_id, "count": len(rows), "downloads": rows}),
+        etag,
+    )
 
 
 @app.get("/api/db/csv_versions/<int:version_id>/case-diff")
@@ -798,9 +1543,44 @@ def api_db_case_diff_for_csv_version(version_id: int) -> Response:
 def api_health() -> Response:
     """Return a JSON health summary for configuration, filesystem, and DB."""
 
-    result = run_health_checks(entrypoint="ui")
-    status = 200 if result.ok else 503
-    return jsonify({"ok": result.ok, "checks": result.checks}), status
+    result = _shared_health_check()
+    response = jsonify({"ok": result.ok, "checks": result.checks})
+    response.status_code = 200 if result.ok else 503
+    response.cache_control.max_age = int(_HEALTH_CACHE_SECONDS)
+    return response
+
+
+def _shared_health_check() -> HealthResult:
+    """Return a recent health result, running at most one check at a time."""
+
+    global _HEALTH_STATE, _HEALTH_PENDING
+
+    with _HEALTH_LOCK:
+        state = _HEALTH_STATE
+        if state is not None and time.monotonic() - state[0] < _HEALTH_CACHE_SECONDS:
+            return state[1]
+        pending = _HEALTH_PENDING
+        if pending is None:
+            pending = _HEALTH_PENDING = Future()
+            owner = True
+        else:
+            owner = False
+
+    if not owner:
+        return pending.result()
+
+    try:
+        result = run_health_checks(entrypoint="ui")
+    except BaseException as exc:
+        with _HEALTH_LOCK:
+            _HEALTH_PENDING = None
+        pending.set_exception(exc)
+        raise
+    with _HEALTH_LOCK:
+        _HEALTH_STATE = (time.monotonic(), result)
+        _HEALTH_PENDING = None
+    pending.set_result(result)
+    return result
 
 
 @app.get("/api/exports/latest.xlsx")
@@ -846,21 +1626,59 @@ def api_runs_latest() -> Response:
 def api_metadata() -> Response:
     """Return the metadata JSON payload for programmatic consumption."""
 
-    meta = load_metadata()
-    return jsonify(meta)
+    validators = _metadata_validators()
+    if _is_not_modified(validators):
+        return _with_validators(Response(status=304), validators)
+
+    if validators is not None and _accepts_gzip():
+        body = _gzipped_metadata(
+            "json", validators[0], lambda meta: (orjson.dumps(meta),)
+        )
+        response = Response(body, mimetype="application/json")
+        return _with_validators(_mark_gzipped(response), validators)
+
+    etag = validators[0] if validators is not None else None
+    response = Response(_metadata_json(etag), mimetype="application/json")
+    response.vary.add("Accept-Encoding")
+    return _with_validators(response, validators)
 
 
 @app.get("/export/csv")
 def export_csv() -> Response:
     """Provide the metadata as a downloadable CSV file."""
 
-    meta = load_metadata()
-    csv_body = _metadata_to_csv(meta)
-    return Response(
-        csv_body,
-        mimetype="text/csv",
-        headers={"Content-Disposition": "attachment; filename=metadata.csv"},
-    )
+    validators = _metadata_validators()
+    if _is_not_modified(validators):
+        return _with_validators(Response(status=304), validators)
+
+    headers = {"Content-Disposition": "attachment; filename=metadata.csv"}
+    if validators is not None and _accepts_gzip():
+        body = _gzipped_metadata(
+            "csv",
+            validators[0],
+            lambda meta: (chunk.encode("utf-8") for chunk in _iter_metadata_csv(meta)),
+        )
+        response = Response(body, mimetype="text/csv", headers=headers)
+        return _with_validators(_mark_gzipped(response), validators)
+
+    rendered = _fresh_metadata_csv()
+    if rendered is not None:
+        # Written after the last scrape; let send_file (or X-Sendfile) stream it.
+        response = send_file(
+            rendered,
+            mimetype="text/csv",
+            as_attachment=True,
+            download_name="metadata.csv",
+            conditional=False,
+            etag=False,
+        )
+        response.vary.add("Accept-Encoding")
+        return _with_validators(response, validators)
+
+    meta = _cached_metadata(validators and validators[0])
+    response = Response(_iter_metadata_csv(meta), mimetype="text/csv", headers=headers)
+    response.vary.add("Accept-Encoding")
+    return _with_validators(response, validators)
 
 
 if __name__ == "__main__":
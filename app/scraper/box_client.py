@@ -1,12 +1,14 @@
 from __future__ import annotations
 
+import shutil
 import time
-import urllib.parse
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, BinaryIO, Optional
 
 import requests
+import urllib3
+from requests.adapters import HTTPAdapter
 
 from .error_codes import ErrorCode
 from .logging_utils import _scraper_event
@@ -14,6 +16,28 @@ from .retry_policy import compute_backoff_seconds, decide_retry
 from .utils import log_line
 
 MIN_PDF_BYTES = 1024
+_PDF_MAGIC = b"%PDF"
+# Buffer size for copying a streamed body to disk.
+_COPY_CHUNK_BYTES = 256 * 1024
+
+# Kept-alive connections per host; covers the parallel download executor.
+_SESSION_POOL_SIZE = 32
+
+
+def _build_session() -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=_SESSION_POOL_SIZE,
+        pool_maxsize=_SESSION_POOL_SIZE,
+        max_retries=0,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Shared across downloads so TLS handshakes and DNS lookups are reused.
+_SESSION = _build_session()
 
 
 @dataclass
@@ -36,11 +60,8 @@ class DownloadError(Exception):
 
 
 def _redact_url(url: str) -> str:
-    try:
-        parsed = urllib.parse.urlparse(url)
-        return urllib.parse.urlunparse(parsed._replace(query=""))
-    except Exception:
-        return url
+    # Signed Box links carry their credentials in the query string.
+    return url.split("#", 1)[0].split("?", 1)[0]
 
 
 def _classify_http_status(status: Optional[int]) -> str:
@@ -62,10 +83,32 @@ def _classify_http_status(status: Optional[int]) -> str:
 
 
 def _validate_pdf_bytes(data: bytes) -> None:
-    if not data.startswith(b"%PDF"):
+    if not data.startswith(_PDF_MAGIC):
         raise DownloadError(ErrorCode.MALFORMED_PDF, "Response is not a PDF")
 
 
+def _read_header(raw: Any) -> bytes:
+    """Read at least the PDF magic bytes from ``raw`` unless it ends first."""
+
+    header = b""
+    while len(header) < len(_PDF_MAGIC):
+        chunk = raw.read(len(_PDF_MAGIC) - len(header))
+        if not chunk:
+            break
+        header += chunk
+    return header
+
+
+def _open_dest(dest_path: Path) -> BinaryIO:
+    """Open ``dest_path`` for writing, creating its directory only if missing."""
+
+    try:
+        return dest_path.open("wb")
+    except FileNotFoundError:
+        dest_path.parent.mkdir(parents=True, exist_ok=True)
+        return dest_path.open("wb")
+
+
 def download_pdf(
     url: str,
     dest_path: Path,
@@ -74,16 +117,20 @@ def download_pdf(
     max_retries: int = 3,
     timeout: int = 120,
     token: Optional[str] = None,
+    session: Optional[requests.Session] = None,
 ) -> BoxDownloadResult:
-    """Download a PDF from ``url`` into ``dest_path`` with retries."""
+    """Download a PDF from ``url`` into ``dest_path`` with retries.
 
-    dest_path.parent.mkdir(parents=True, exist_ok=True)
+    Without an ``http_client`` the body is fetched through ``session``,
+    defaulting to a module-wide keep-alive session.
+    """
 
     safe_url = _redact_url(url)
     last_error_message: Optional[str] = None
     last_status: Optional[int] = None
     error_code: Optional[str] = None
     error_message: Optional[str] = None
+    http_session = session or _SESSION
 
     for attempt in range(1, max_retries + 1):
         status: Optional[int] = None
@@ -112,7 +159,8 @@ def download_pdf(
                 if len(body_bytes) < MIN_PDF_BYTES:
                     raise DownloadError(ErrorCode.MALFORMED_PDF, "PDF appears truncated")
 
-                dest_path.write_bytes(body_bytes)
+                with _open_dest(dest_path) as handle:
+                    handle.write(body_bytes)
                 bytes_written = len(body_bytes)
                 _scraper_event(
                     "box",
@@ -127,18 +175,17 @@ def download_pdf(
                 )
                 return BoxDownloadResult(True, status, bytes_written, None, None)
 
-            with requests.get(url, stream=True, timeout=timeout) as resp:
+            with http_session.get(url, stream=True, timeout=timeout) as resp:
                 status = resp.status_code
                 resp.raise_for_status()
-                first_chunk = True
-                with dest_path.open("wb") as handle:
-                    for chunk in resp.iter_content(chunk_size=8192):
-                        if not chunk:
-                            continue
-                        if first_chunk:
-                            _validate_pdf_bytes(chunk)
-                            first_chunk = False
-                        handle.write(chunk)
+                # Check the magic bytes, then let copyfileobj move the rest of
+                # the body to disk in large blocks.
+                resp.raw.decode_content = True
+                header = _read_header(resp.raw)
+                _validate_pdf_bytes(header)
+                with _open_dest(dest_path) as handle:
+                    handle.write(header)
+                    shutil.copyfileobj(resp.raw, handle, _COPY_CHUNK_BYTES)
 
             file_size = dest_path.stat().st_size
             if file_size < MIN_PDF_BYTES:
@@ -170,7 +217,13 @@ def download_pdf(
                 error_code=error_code,
                 http_status=status,
             )
-        except (requests.Timeout, requests.ConnectionError) as exc:
+        # Bodies are read from ``resp.raw``, so a stalled or dropped transfer
+        # surfaces as a urllib3 error rather than a requests one.
+        except (
+            requests.Timeout,
+            requests.ConnectionError,
+            urllib3.exceptions.HTTPError,
+        ) as exc:
             last_error_message = str(exc)
             error_code = ErrorCode.NETWORK
             error_message = last_error_message
@@ -44,12 +44,17 @@ import html
 import io
 import os
 import re
+import sys
 import urllib.parse
+from bisect import bisect_left
 from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Set, TextIO, Tuple
 
 import requests
+import urllib3
 
 from . import config, db_case_index, sources
 from .utils import log_line
@@ -57,29 +62,33 @@ from .utils import log_line
 
 ACTION_SPLIT_RE = re.compile(r"^([A-Z]+[0-9]+[0-9]{8})([A-Z0-9]+)?$")
 TOKEN_SPLIT_RE = re.compile(r"[|,;/\\\s]+")
+_NON_ALNUM_SUB = re.compile(r"[^A-Z0-9]+").sub
 
 
+@lru_cache(maxsize=1 << 16)
 def normalize_action_token(raw: str) -> str:
     """Normalise an Actions token to an uppercase alphanumeric string."""
 
     if raw is None:
         return ""
 
-    token = html.unescape(str(raw))
-    token = urllib.parse.unquote_plus(token)
-    token = token.replace("\u00a0", " ")
-    token = re.sub(r"\s+", " ", token).strip()
-    if not token:
-        return ""
+    token = str(raw)
+    if token.isascii() and token.isalnum():
+        # Most tokens are already bare codes; nothing to unescape or strip.
+        return token.upper()
 
-    token = token.upper()
-    token = re.sub(r"[^A-Z0-9]+", "", token)
-    return token
+    token = html.unescape(token)
+    token = urllib.parse.unquote_plus(token)
+    # Whitespace (including NBSP) is dropped along with other punctuation.
+    return _NON_ALNUM_SUB("", token.upper())
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CaseRow:
-    """Lightweight representation of a case row from the judgments CSV."""
+    """Lightweight representation of a case row from the judgments CSV.
+
+    Slotted, since an index holds one instance per action token.
+    """
 
     action: str
     code: str
@@ -99,16 +108,123 @@ AJAX_FNAME_INDEX: Dict[str, CaseRow] = {}
 CASES_ALL: List[CaseRow] = []
 CASES_BY_SOURCE: Dict[str, List[CaseRow]] = {}
 
+# Posting lists of AJAX_FNAME_INDEX keys by n-gram, used to narrow partial
+# fname matches. Rebuilt on demand whenever the index size changes.
+_NGRAM_SIZE = 6
+_NGRAM_INDEX: Dict[str, List[str]] = {}
+_NGRAM_INDEX_KEYS = -1
+
+# Per-source lookups derived from CASES_BY_SOURCE: the case list and its
+# length when they were built, exact action/code keys, and (action, position)
+# pairs in sorted order for prefix searches.
+_SOURCE_LOOKUPS: Dict[
+    str, Tuple[List[CaseRow], int, Dict[str, CaseRow], List[Tuple[str, int]]]
+] = {}
+
 
 def _reset_indexes() -> None:
+    global _NGRAM_INDEX_KEYS
+
     CASES_BY_ACTION.clear()
     AJAX_FNAME_INDEX.clear()
     CASES_ALL.clear()
     CASES_BY_SOURCE.clear()
+    _NGRAM_INDEX.clear()
+    _NGRAM_INDEX_KEYS = -1
+    _SOURCE_LOOKUPS.clear()
+    normalize_action_token.cache_clear()
 
 
-def _resolve_csv_stream(csv_path: str) -> Tuple[Optional[Iterable[str]], Optional[str]]:
-    """Return an iterable of CSV lines and the path description used."""
+def _ngrams(text: str) -> Set[str]:
+    return {text[i : i + _NGRAM_SIZE] for i in range(len(text) - _NGRAM_SIZE + 1)}
+
+
+def _ngram_index() -> Dict[str, List[str]]:
+    """Return the n-gram posting lists for the current AJAX fname index."""
+
+    global _NGRAM_INDEX_KEYS
+
+    if _NGRAM_INDEX_KEYS != len(AJAX_FNAME_INDEX):
+        _NGRAM_INDEX.clear()
+        for action in AJAX_FNAME_INDEX:
+            for gram in _ngrams(action):
+                _NGRAM_INDEX.setdefault(gram, []).append(action)
+        _NGRAM_INDEX_KEYS = len(AJAX_FNAME_INDEX)
+    return _NGRAM_INDEX
+
+
+def _source_lookup(
+    source: str, cases: List[CaseRow]
+) -> Tuple[Dict[str, CaseRow], List[Tuple[str, int]]]:
+    """Return exact and prefix lookups for ``cases``, rebuilt when they change.
+
+    The first case in ``cases`` whose action or code equals a key wins,
+    matching the order of the linear scan these lookups replace.
+    """
+
+    cached = _SOURCE_LOOKUPS.get(source)
+    # A replaced list of the same length must not reuse stale lookups.
+    if cached is not None and cached[0] is cases and cached[1] == len(cases):
+        return cached[2], cached[3]
+
+    exact: Dict[str, CaseRow] = {}
+    prefixes: List[Tuple[str, int]] = []
+    for position, case in enumerate(cases):
+        action = case.action or ""
+        exact.setdefault(action, case)
+        if case.code is not None:
+            exact.setdefault(case.code, case)
+        prefixes.append((action, position))
+    prefixes.sort()
+    _SOURCE_LOOKUPS[source] = (cases, len(cases), exact, prefixes)
+    return exact, prefixes
+
+
+def _partial_fname_matches(candidate: str) -> List[Tuple[int, int, str, CaseRow]]:
+    """Return ``(overlap, start, action, case)`` for actions that contain, or
+    are contained in, ``candidate``.
+
+    Actions containing a long enough candidate must share all of its
+    n-grams, so only the shortest posting list is checked. Actions inside
+    the candidate are found by looking up each of its substrings.
+    """
+
+    matches: List[Tuple[int, int, str, CaseRow]] = []
+
+    pool: Iterable[str]
+    if len(candidate) >= _NGRAM_SIZE:
+        index = _ngram_index()
+        postings = [index.get(gram, []) for gram in _ngrams(candidate)]
+        pool = min(postings, key=len)
+    else:
+        pool = AJAX_FNAME_INDEX
+    for action in pool:
+        start = action.find(candidate)
+        if start >= 0:
+            matches.append((len(candidate), start, action, AJAX_FNAME_INDEX[action]))
+
+    seen: Set[str] = set()
+    length = len(candidate)
+    for start in range(length):
+        for end in range(start + 1, length + 1):
+            action = candidate[start:end]
+            case = AJAX_FNAME_INDEX.get(action)
+            if case is not None and action not in seen:
+                seen.add(action)
+                matches.append((len(action), start, action, case))
+
+    return matches
+
+
+# Reused for CSV downloads so repeated loads keep the connection alive.
+_CSV_SESSION = requests.Session()
+
+
+def _resolve_csv_stream(csv_path: str) -> Tuple[Optional[TextIO], Optional[str]]:
+    """Return an open CSV text stream and the path description used.
+
+    Callers own the stream; closing it also closes a remote response.
+    """
 
     if not csv_path:
         return None, None
@@ -116,18 +232,26 @@ def _resolve_csv_stream(csv_path: str) -> Tuple[Optional[Iterable[str]], Optiona
     normalized = csv_path.strip()
     # Direct URL support for convenience during tests/debugging.
     if normalized.lower().startswith(("http://", "https://")):
+        response = None
         try:
-            response = requests.get(
+            response = _CSV_SESSION.get(
                 normalized,
                 headers=config.COMMON_HEADERS,
                 timeout=120,
+                stream=True,
             )
             response.raise_for_status()
-            text = response.content.decode("utf-8-sig")
-            return io.StringIO(text), normalized
         except Exception as exc:  # noqa: BLE001
             log_line(f"[CSV] Failed to download {normalized}: {exc}")
+            if response is not None:
+                response.close()
             return None, None
+        # Decode the body as it arrives so parsing overlaps the download; keep
+        # the raw stream open at EOF so TextIOWrapper sees an empty read. A
+        # fully read body has already handed its connection back to the pool.
+        response.raw.decode_content = True
+        response.raw.auto_close = False
+        return io.TextIOWrapper(response.raw, encoding="utf-8-sig", newline=""), normalized
 
     candidates = [
         Path(normalized),
@@ -144,6 +268,16 @@ def _resolve_csv_stream(csv_path: str) -> Tuple[Optional[Iterable[str]], Optiona
     return None, None
 
 
+def _first_value(row: List[str], indexes: Tuple[int, ...], default: str = "") -> str:
+    """Return the first non-empty cell of ``row`` among ``indexes``, stripped."""
+
+    width = len(row)
+    for index in indexes:
+        if index < width and row[index]:
+            return row[index].strip()
+    return default
+
+
 def load_cases_from_csv(
     csv_path: str,
     *,
@@ -178,47 +312,94 @@ def load_cases_from_csv(
             )
             return
 
+    log_line(f"[CSV] Loading cases from {description}")
+
+    # Remote CSVs are parsed as they download, so build the new index aside
+    # and only replace the current one once the whole body has been read.
+    try:
+        by_action, loaded_cases, skipped_blank = _parse_cases_csv(stream)
+    except (OSError, UnicodeDecodeError, csv.Error, urllib3.exceptions.HTTPError) as exc:
+        log_line(f"[CSV] Failed to read {description}: {exc}; keeping the previous index.")
+        return
+    finally:
+        stream.close()
+
     _reset_indexes()
-    CASES_BY_SOURCE[source_norm] = []
+    CASES_BY_ACTION.update(by_action)
+    if source_norm == sources.UNREPORTED_JUDGMENTS:
+        AJAX_FNAME_INDEX.update(by_action)
+    CASES_ALL.extend(loaded_cases)
+    CASES_BY_SOURCE[source_norm] = list(loaded_cases)
 
-    log_line(f"[CSV] Loading cases from {description}")
+    log_line(
+        f"[CSV] Loaded {len(loaded_cases)} case token(s) from CSV; "
+        f"skipped {skipped_blank} row(s) without usable Actions entries."
+    )
+
+
+def _parse_cases_csv(
+    stream: Iterable[str],
+) -> Tuple[Dict[str, CaseRow], List[CaseRow], int]:
+    """Parse judgments CSV rows into ``(by_action, cases, skipped_blank)``."""
+
+    by_action: Dict[str, CaseRow] = {}
+    loaded_cases: List[CaseRow] = []
+
+    reader = csv.reader(stream)
+    header = next((row for row in reader if row), [])
+    # Later duplicates of a column name win, as they did with DictReader.
+    columns = {name: index for index, name in enumerate(header)}
+
+    def _indexes(*names: str) -> Tuple[int, ...]:
+        return tuple(columns[name] for name in names if name in columns)
+
+    actions_cols = _indexes("Actions", "Action")
+    title_cols = _indexes("Title", "Case Title", "Subject")
+    subject_cols = _indexes("Subject")
+    court_cols = _indexes("Court", "Court file")
+    category_cols = _indexes("Category")
+    date_cols = _indexes("Judgment Date", "Date")
+    cause_cols = _indexes("Cause Number", "Cause number", "Cause No.", "Cause")
 
-    reader = csv.DictReader(stream)
-    loaded = 0
     skipped_blank = 0
 
     for row in reader:
-        actions_raw = html.unescape((row.get("Actions") or row.get("Action") or "").strip())
+        if not row:
+            continue
+        actions_raw = html.unescape(_first_value(row, actions_cols))
         if not actions_raw:
             skipped_blank += 1
             continue
 
-        title = (row.get("Title") or row.get("Case Title") or row.get("Subject") or "").strip()
-        subject = (row.get("Subject") or title or "").strip()
-        court = (row.get("Court") or row.get("Court file") or "").strip()
-        category = (row.get("Category") or "").strip()
-        judgment_date = (row.get("Judgment Date") or row.get("Date") or "").strip()
-        cause_number = (
-            row.get("Cause Number")
-            or row.get("Cause number")
-            or row.get("Cause No.")
-            or row.get("Cause")
-            or ""
-        ).strip()
+        title = _first_value(row, title_cols)
+        subject = _first_value(row, subject_cols, title)
+        # Few distinct courts and categories repeat across many rows.
+        court = sys.intern(_first_value(row, court_cols))
+        category = sys.intern(_first_value(row, category_cols))
+        judgment_date = _first_value(row, date_cols)
+        cause_number = _first_value(row, cause_cols)
 
         raw_tokens = [tok.strip() for tok in TOKEN_SPLIT_RE.split(actions_raw) if tok.strip()]
         if not raw_tokens:
             skipped_blank += 1
             continue
 
-        row_extra = {k: (v or "").strip() for k, v in row.items()}
-        row_extra["_raw_actions"] = actions_raw
+        # Built on the first usable token and shared by all of the row's cases.
+        row_extra: Optional[Dict[str, str]] = None
 
         for token in raw_tokens:
             normalized = normalize_action_token(token)
             if not normalized:
                 continue
 
+            if row_extra is None:
+                width = len(row)
+                row_extra = {
+                    name: row[index].strip() if index < width else ""
+                    for name, index in columns.items()
+                }
+                row_extra["_raw_actions"] = actions_raw
+
             match = ACTION_SPLIT_RE.match(normalized)
             if match:
                 code = match.group(1)
@@ -240,24 +421,17 @@ def load_cases_from_csv(
                 cause_number=cause_number,
                 extra=row_extra,
             )
-            existing = CASES_BY_ACTION.get(normalized)
+            existing = by_action.get(normalized)
             if existing and existing.extra != case.extra:
                 log_line(
                     f"[CSV] Duplicate action token {normalized} encountered; keeping first occurrence."
                 )
                 continue
 
-            CASES_BY_ACTION[normalized] = case
-            if source_norm == sources.UNREPORTED_JUDGMENTS:
-                AJAX_FNAME_INDEX[normalized] = case
-            CASES_ALL.append(case)
-            CASES_BY_SOURCE[source_norm].append(case)
-            loaded += 1
+            by_action[normalized] = case
+            loaded_cases.append(case)
 
-    log_line(
-        f"[CSV] Loaded {loaded} case token(s) from CSV; "
-        f"skipped {skipped_blank} row(s) without usable Actions entries."
-    )
+    return by_action, loaded_cases, skipped_blank
 
 
 def load_cases_index_from_db(
@@ -300,13 +474,13 @@ def load_cases_index_from_db(
             suffix=suffix,
             title=(record.get("title") or "").strip(),
             subject=(record.get("subject") or record.get("title") or "").strip(),
-            court=(record.get("court") or "").strip(),
-            category=(record.get("category") or "").strip(),
+            court=sys.intern((record.get("court") or "").strip()),
+            category=sys.intern((record.get("category") or "").strip()),
             judgment_date=(record.get("judgment_date") or "").strip(),
             sort_judgment_date=(record.get("sort_judgment_date") or "").strip(),
             cause_number=(record.get("cause_number") or "").strip(),
             extra={
-                "_source": record.get("source", ""),
+                "_source": sys.intern(record.get("source") or ""),
                 "_is_active": str(record.get("is_active", "")),
             },
         )
@@ -370,18 +544,7 @@ def find_case_by_fname(
         if direct or strict:
             return direct
 
-        matches: List[Tuple[int, int, str, CaseRow]] = []
-        for action, case in AJAX_FNAME_INDEX.items():
-            if candidate in action:
-                start = action.find(candidate)
-                overlap = len(candidate)
-                matches.append((overlap, start, action, case))
-                continue
-            if action in candidate:
-                start = candidate.find(action)
-                overlap = len(action)
-                matches.append((overlap, start, action, case))
-
+        matches = _partial_fname_matches(candidate)
         if not matches:
             return None
 
@@ -411,18 +574,24 @@ def find_case_by_fname(
         )
         return None
 
-    for case in cases_for_source:
-        action = getattr(case, "action", "") or ""
-        if action == candidate or getattr(case, "code", None) == candidate:
-            return case
+    exact, prefixes = _source_lookup(source_norm, cases_for_source)
+    hit = exact.get(candidate)
+    if hit is not None:
+        return hit
 
     if strict:
         return None
 
-    for case in cases_for_source:
-        action = getattr(case, "action", "") or ""
-        if candidate and action.startswith(candidate):
-            return case
+    # Of the actions starting with ``candidate`` (a contiguous run of the
+    # sorted list), return the one loaded first.
+    first: Optional[int] = None
+    for action, position in islice(prefixes, bisect_left(prefixes, (candidate,)), None):
+        if not action.startswith(candidate):
+            break
+        if first is None or position < first:
+            first = position
+    if first is not None:
+        return cases_for_source[first]
 
     log_line(
         f"[MAPPING][WARN] No case found for fname={candidate!r} source={source_norm!r}"
@@ -185,6 +185,17 @@ RECORD_REPLAY_FIXTURES: bool = os.getenv("BAILIIKC_RECORD_REPLAY_FIXTURES", "0")
     "false",
 }
 
+# Internal nginx location that aliases DATA_DIR. When set, file downloads are
+# handed to the proxy via X-Accel-Redirect instead of streamed from Python.
+X_ACCEL_REDIRECT_PREFIX: str = (
+    os.getenv("BAILIIKC_X_ACCEL_REDIRECT_PREFIX", "").strip().rstrip("/")
+)
+# Apache/lighttpd equivalent: send file downloads as X-Sendfile headers.
+USE_X_SENDFILE: bool = os.getenv("BAILIIKC_USE_X_SENDFILE", "0").strip().lower() not in {
+    "0",
+    "false",
+}
+
 WEBHOOK_SHARED_SECRET: str = os.getenv("BAILIIKC_WEBHOOK_SHARED_SECRET", "").strip()
 WEBHOOK_NEW_LIMIT_MAX: int = int(os.getenv("BAILIIKC_WEBHOOK_NEW_LIMIT_MAX", "50"))
 
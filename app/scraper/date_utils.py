@@ -2,34 +2,59 @@ from __future__ import annotations
 
 import re
 from datetime import datetime
-from typing import Iterable
+from functools import lru_cache
+from typing import Tuple
 
-_DATE_FORMATS: Iterable[str] = (
+_DATE_FORMATS: Tuple[str, ...] = (
     "%Y-%m-%d",
     "%Y-%b-%d",
     "%d/%m/%Y",
     "%d-%b-%Y",
 )
+_NON_DIGIT_RE = re.compile(r"[^0-9]")
 
 
+def _is_iso_date(candidate: str) -> bool:
+    """Return ``True`` when ``candidate`` is already shaped like YYYY-MM-DD."""
+
+    return (
+        len(candidate) == 10
+        and candidate.isascii()
+        and candidate[4] == "-"
+        and candidate[7] == "-"
+        and candidate[:4].isdigit()
+        and candidate[5:7].isdigit()
+        and candidate[8:].isdigit()
+    )
+
+
+@lru_cache(maxsize=4096)
 def sortable_date(value: str) -> str:
     """Return an ISO-like string suitable for sorting judgement dates.
 
     Normalises a variety of expected input formats to YYYY-MM-DD. Returns an
-    empty string when the value cannot be reasonably parsed.
+    empty string when the value cannot be reasonably parsed. Results are
+    memoised because report rows repeat the same judgment dates heavily.
     """
 
     candidate = (value or "").strip()
     if not candidate:
         return ""
 
+    if _is_iso_date(candidate):
+        return candidate
+
     for fmt in _DATE_FORMATS:
         try:
             return datetime.strptime(candidate, fmt).strftime("%Y-%m-%d")
         except ValueError:
             continue
 
-    digits = re.sub(r"[^0-9]", "", candidate)
+    # Fewer than eight characters can never yield a YYYYMMDD digit run.
+    if len(candidate) < 8:
+        return ""
+
+    digits = _NON_DIGIT_RE.sub("", candidate)
     if len(digits) >= 8:
         return f"{digits[:4]}-{digits[4:6]}-{digits[6:8]}"
     return ""
@@ -7,14 +7,29 @@ logging.
 from __future__ import annotations
 
 import sqlite3
+import threading
 import time
 from pathlib import Path
-from typing import Iterable, Mapping, Optional
+from typing import Dict, Iterable, Mapping, Optional, Tuple
 
 from . import config
 
 DB_PATH: Path = config.DB_PATH
 
+# Applied to every connection. ``synchronous=NORMAL`` is durable in WAL mode
+# (only the last commits can roll back on power loss) and skips an fsync per
+# transaction; the mmap window lets readers share the OS page cache.
+_CONNECTION_PRAGMAS: Tuple[str, ...] = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA busy_timeout=5000",
+)
+
+# Connections used only for ``PRAGMA data_version`` polling, per database path.
+_VERSION_CONNECTIONS: Dict[Path, sqlite3.Connection] = {}
+_VERSION_LOCK = threading.Lock()
+
 
 def get_connection() -> sqlite3.Connection:
     """Return a SQLite connection to the project database.
@@ -27,9 +42,35 @@ def get_connection() -> sqlite3.Connection:
     DB_PATH.parent.mkdir(parents=True, exist_ok=True)
     conn = sqlite3.connect(DB_PATH, check_same_thread=False)
     conn.row_factory = sqlite3.Row
+    for pragma in _CONNECTION_PRAGMAS:
+        conn.execute(pragma)
     return conn
 
 
+def data_version() -> Tuple[object, ...]:
+    """Return a cheap token that changes whenever the database is written.
+
+    Reads ``PRAGMA data_version`` on a long-lived connection kept per database
+    path. SQLite changes that value whenever any other connection, in this or
+    another process, commits; unlike the header change counter it also moves
+    for WAL commits and checkpoints. The pragma only consults the pager, so
+    no table is touched.
+    """
+
+    with _VERSION_LOCK:
+        if not DB_PATH.exists():
+            return (str(DB_PATH), None)
+        conn = _VERSION_CONNECTIONS.get(DB_PATH)
+        try:
+            if conn is None:
+                conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+                _VERSION_CONNECTIONS[DB_PATH] = conn
+            version = conn.execute("PRAGMA data_version").fetchone()[0]
+        except sqlite3.Error:
+            return (str(DB_PATH), None)
+    return (str(DB_PATH), version)
+
+
 def initialize_schema() -> None:
     """Create the baseline tables if they do not yet exist.
 
@@ -139,6 +180,9 @@ def initialize_schema() -> None:
     )
 
     conn = get_connection()
+    # WAL is persistent in the database file, so setting it once here covers
+    # every later connection: readers no longer block behind a scrape's writes.
+    conn.execute("PRAGMA journal_mode=WAL")
     with conn:
         for statement in statements:
             conn.execute(statement)
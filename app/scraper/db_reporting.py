@@ -3,7 +3,7 @@ from __future__ import annotations
 import json
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from . import config, db, sources, worklist
 from .date_utils import sortable_date
@@ -547,22 +547,20 @@ def get_run_download_stats(run_id: int) -> Dict[str, int]:
     return totals
 
 
-def get_download_rows_for_run(
-    run_id: Optional[int] = None,
-    status_filter: Optional[str] = None,
-    *,
-    source: str | None = None,
-) -> List[Dict[str, Any]]:
-    """Return download rows for the given run, optionally filtered by status/source."""
+def _resolve_download_scope(
+    conn: Any, run_id: Optional[int], source: str | None
+) -> Optional[tuple[int, Optional[str]]]:
+    """Return ``(run_id, source)`` to report on, or None when there is no run.
+
+    Falls back to the latest run when ``run_id`` is not given and infers the
+    source from an explicit run's parameters when ``source`` is omitted.
+    """
 
     resolved_run_id = run_id or get_latest_run_id()
     if resolved_run_id is None:
         log_line("[DB_REPORTING] No runs found when building download rows")
-        return []
-
-    normalized_source = sources.coerce_source(source) if source else None
+        return None
 
-    conn = db.get_connection()
     normalized_source = sources.coerce_source(source) if source else None
 
     if normalized_source is None and run_id:
@@ -573,12 +571,117 @@ def get_download_rows_for_run(
             log_line(
                 f"[DB_REPORTING] Requested download rows for missing run_id={resolved_run_id}"
             )
-            return []
+            return None
         normalized_source = _infer_run_source(run_row["params_json"] or "")
 
+    return resolved_run_id, normalized_source
+
+
+def _download_scope_filter(
+    run_id: int, source: Optional[str], status_filter: Optional[str]
+) -> tuple[str, list[Any]]:
+    """Return the ``FROM ... WHERE`` clause shared by download row queries."""
+
+    clauses = [
+        """
+        FROM downloads d
+        JOIN cases c ON d.case_id = c.id
+        WHERE d.run_id = ?
+        """
+    ]
+    params: list[Any] = [run_id]
+
+    if source:
+        clauses.append("AND c.source = ?")
+        params.append(source)
+
+    if status_filter:
+        clauses.append("AND d.status = ?")
+        params.append(status_filter)
+
+    return "\n".join(clauses), params
+
+
+def get_download_facets_for_run(
+    run_id: Optional[int] = None,
+    status_filter: Optional[str] = None,
+    *,
+    source: str | None = None,
+) -> Dict[str, Any]:
+    """Return the row count and distinct courts/categories for download rows.
+
+    Uses the same filters as :func:`get_download_rows_for_run` but lets SQLite
+    do the counting and de-duplication instead of materialising every row.
+    """
+
+    conn = db.get_connection()
+    scope = _resolve_download_scope(conn, run_id, source)
+    if scope is None:
+        return {"count": 0, "courts": [], "categories": []}
+
+    scope_sql, params = _download_scope_filter(*scope, status_filter)
+    count = conn.execute(f"SELECT COUNT(*) {scope_sql}", params).fetchone()[0]
+    facets: Dict[str, List[str]] = {}
+    for column, key in (("court", "courts"), ("category", "categories")):
+        cursor = conn.execute(
+            f"""
+            SELECT DISTINCT c.{column} AS value
+            {scope_sql}
+            AND c.{column} IS NOT NULL AND c.{column} != ''
+            ORDER BY value
+            """,
+            params,
+        )
+        facets[key] = [row["value"] for row in cursor.fetchall()]
+
+    return {"count": count, **facets}
+
+
+def get_download_rows_for_run(
+    run_id: Optional[int] = None,
+    status_filter: Optional[str] = None,
+    *,
+    source: str | None = None,
+) -> List[Dict[str, Any]]:
+    """Return download rows for the given run, optionally filtered by status/source."""
+
+    return [
+        row
+        for _, row in iter_download_rows(run_id, status_filter, source=source)
+    ]
+
+
+# Rows pulled from SQLite per fetchmany() call while iterating downloads.
+DOWNLOAD_ROWS_BATCH = 500
+
+
+def iter_download_rows(
+    run_id: Optional[int] = None,
+    status_filter: Optional[str] = None,
+    *,
+    source: str | None = None,
+    limit: Optional[int] = None,
+    after_id: Optional[int] = None,
+) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """Yield ``(download_id, row)`` pairs in ``downloads.id`` order.
+
+    Rows are fetched in batches of ``DOWNLOAD_ROWS_BATCH`` so callers can
+    start emitting before the query is exhausted. ``after_id`` and ``limit``
+    page through the rows by key: pass the last ``download_id`` seen to
+    continue where the previous page stopped.
+    """
+
+    conn = db.get_connection()
+    scope = _resolve_download_scope(conn, run_id, source)
+    if scope is None:
+        return
+    normalized_source = scope[1]
+
+    scope_sql, params = _download_scope_filter(*scope, status_filter)
     query = [
         """
         SELECT
+            d.id,
             d.run_id,
             d.status,
             d.last_attempt_at,
@@ -594,64 +697,63 @@ def get_download_rows_for_run(
             c.judgment_date,
             c.is_criminal,
             c.source AS source
-        FROM downloads d
-        JOIN cases c ON d.case_id = c.id
-        WHERE d.run_id = ?
-        """
+        """,
+        scope_sql,
     ]
-    params: list[Any] = [resolved_run_id]
-
-    if normalized_source:
-        query.append("AND c.source = ?")
-        params.append(normalized_source)
-
-    if status_filter:
-        query.append("AND d.status = ?")
-        params.append(status_filter)
-
+    if after_id is not None:
+        query.append("AND d.id > ?")
+        params.append(after_id)
     query.append("ORDER BY d.id ASC")
+    if limit is not None:
+        query.append("LIMIT ?")
+        params.append(limit)
 
     cursor = conn.execute("\n".join(query), params)
-    rows: List[Dict[str, Any]] = []
-
-    for row in cursor.fetchall():
-        saved_path = row["file_path"] or ""
-        judgment_date = row["judgment_date"] or ""
-        actions_token = row["action_token_norm"] or row["action_token_raw"] or ""
-        title = row["title"] or actions_token or saved_path
-        filename = Path(saved_path).name if saved_path else ""
-        file_size_bytes = row["file_size_bytes"]
-        if file_size_bytes:
-            try:
-                size_kb = round(file_size_bytes / 1024.0, 1)
-            except TypeError:
-                size_kb = 0
-        else:
+    cursor.arraysize = DOWNLOAD_ROWS_BATCH
+
+    while True:
+        batch = cursor.fetchmany()
+        if not batch:
+            return
+        for row in batch:
+            row_source = sources.coerce_source(row["source"])
+            if normalized_source and row_source != normalized_source:
+                continue
+            yield row["id"], _download_row_payload(row, row_source)
+
+
+def _download_row_payload(row: Any, row_source: str) -> Dict[str, Any]:
+    """Shape a joined downloads/cases row for the report table."""
+
+    saved_path = row["file_path"] or ""
+    judgment_date = row["judgment_date"] or ""
+    actions_token = row["action_token_norm"] or row["action_token_raw"] or ""
+    title = row["title"] or actions_token or saved_path
+    filename = Path(saved_path).name if saved_path else ""
+    file_size_bytes = row["file_size_bytes"]
+    if file_size_bytes:
+        try:
+            size_kb = round(file_size_bytes / 1024.0, 1)
+        except TypeError:
             size_kb = 0
+    else:
+        size_kb = 0
 
-        row_source = sources.coerce_source(row["source"])
-        if normalized_source and row_source != normalized_source:
-            continue
-
-        rows.append(
-            {
-                "actions_token": actions_token,
-                "title": title,
-                "subject": row["title"] or "",
-                "court": row["court"] or "",
-                "category": row["category"] or "",
-                "judgment_date": judgment_date,
-                "sort_judgment_date": sortable_date(str(judgment_date)),
-                "cause_number": row["cause_number"] or "",
-                "downloaded_at": row["last_attempt_at"] or "",
-                "saved_path": saved_path,
-                "filename": filename,
-                "size_kb": size_kb,
-                "source": row_source,
-            }
-        )
-
-    return rows
+    return {
+        "actions_token": actions_token,
+        "title": title,
+        "subject": row["title"] or "",
+        "court": row["court"] or "",
+        "category": row["category"] or "",
+        "judgment_date": judgment_date,
+        "sort_judgment_date": sortable_date(str(judgment_date)),
+        "cause_number": row["cause_number"] or "",
+        "downloaded_at": row["last_attempt_at"] or "",
+        "saved_path": saved_path,
+        "filename": filename,
+        "size_kb": size_kb,
+        "source": row_source,
+    }
 
 
 def get_case_diff_for_csv_version(version_id: int) -> Dict[str, Any]:
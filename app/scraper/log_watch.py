@@ -0,0 +1,284 @@
+"""Wait for log file changes without busy polling.
+
+On Linux this wraps ``inotify`` through ``ctypes`` so SSE tailers can sleep in
+the kernel until the watched log is written. The log's directory is watched
+too, so a run rotating to a fresh log file wakes tailers immediately.
+Elsewhere (or if inotify cannot be initialised) ``LogWatcher.wait`` degrades
+to a short ``time.sleep`` so callers keep the previous polling behaviour.
+
+``LogBroadcaster`` owns a single tail loop and fans appended lines out to any
+number of subscriber queues, so concurrent SSE clients share one file handle.
+Lines that arrive together are published as one batch.
+"""
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import queue
+import select
+import struct
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Callable, List, Optional, Set
+
+from .utils import log_line
+
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+
+_FILE_EVENTS = IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_DELETE_SELF | IN_MOVE_SELF
+_DIR_EVENTS = IN_CREATE | IN_MOVED_TO | IN_MODIFY
+_EVENT_HEADER = struct.Struct("iIII")
+_READ_SIZE = 4096
+
+FALLBACK_POLL_SECONDS = 1.0
+# Pending batches kept per subscriber; a stalled client loses its oldest ones.
+SUBSCRIBER_BACKLOG = 1024
+
+
+def _load_libc() -> Optional[ctypes.CDLL]:
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+    except (OSError, AttributeError):
+        return None
+    return libc
+
+
+_LIBC = _load_libc()
+
+
+class LogWatcher:
+    """Block until a watched file changes, using inotify where available."""
+
+    def __init__(self, path: Path | None = None) -> None:
+        self._fd: Optional[int] = None
+        self._wd: Optional[int] = None
+        self._dir_wd: Optional[int] = None
+        self._name = b""
+        self._sibling_changed = False
+        if _LIBC is not None:
+            fd = _LIBC.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+            if fd >= 0:
+                self._fd = fd
+        if path is not None:
+            self.watch(path)
+
+    @property
+    def uses_inotify(self) -> bool:
+        """Return ``True`` when waits are backed by kernel notifications."""
+
+        return self._fd is not None and self._wd is not None
+
+    def watch(self, path: Path) -> None:
+        """Watch ``path`` and its directory, replacing any previous watches."""
+
+        if self._fd is None or _LIBC is None:
+            return
+        for wd in {self._wd, self._dir_wd}:
+            if wd is not None:
+                _LIBC.inotify_rm_watch(self._fd, wd)
+        self._wd = self._add_watch(path, _FILE_EVENTS)
+        self._dir_wd = self._add_watch(path.parent, _DIR_EVENTS)
+        self._name = os.fsencode(path.name)
+        self._sibling_changed = False
+
+    def _add_watch(self, path: Path, mask: int) -> Optional[int]:
+        wd = _LIBC.inotify_add_watch(self._fd, os.fsencode(str(path)), mask)
+        return wd if wd >= 0 else None
+
+    def sibling_changed(self) -> bool:
+        """Return whether another file in the watched directory was created or
+        written since the last call, clearing the flag."""
+
+        changed = self._sibling_changed
+        self._sibling_changed = False
+        return changed
+
+    def wait(self, timeout: float) -> bool:
+        """Wait up to ``timeout`` seconds for a change.
+
+        Returns ``True`` when a change notification arrived. Without inotify
+        this sleeps for at most ``FALLBACK_POLL_SECONDS`` and returns ``True``
+        so callers simply re-check the file as they did when polling.
+        """
+
+        if not self.uses_inotify:
+            time.sleep(max(0.0, min(timeout, FALLBACK_POLL_SECONDS)))
+            return True
+
+        ready, _, _ = select.select([self._fd], [], [], max(0.0, timeout))
+        if not ready:
+            return False
+        self._drain()
+        return True
+
+    def _drain(self) -> None:
+        while True:
+            try:
+                buffer = os.read(self._fd, _READ_SIZE)
+            except OSError:
+                return
+            if not buffer:
+                return
+            self._scan_events(buffer)
+
+    def _scan_events(self, buffer: bytes) -> None:
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(buffer):
+            wd, _mask, _cookie, length = _EVENT_HEADER.unpack_from(buffer, offset)
+            start = offset + _EVENT_HEADER.size
+            offset = start + length
+            if wd != self._dir_wd or self._dir_wd is None:
+                continue
+            name = buffer[start:offset].rstrip(b"\0")
+            if name and name != self._name:
+                self._sibling_changed = True
+
+    def close(self) -> None:
+        """Release the inotify descriptor."""
+
+        if self._fd is not None:
+            try:
+                os.close(self._fd)
+            except OSError:
+                pass
+        self._fd = None
+        self._wd = None
+        self._dir_wd = None
+
+    def __enter__(self) -> "LogWatcher":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+class LogBroadcaster:
+    """Tail the active log once and publish new lines to subscriber queues.
+
+    ``path_provider`` returns the log file currently receiving lines; it is
+    re-checked at most every ``rotation_check_seconds`` so rotation to a new
+    run log is followed without consulting it on every line. The tail thread
+    starts with the first subscriber and exits once none remain.
+    """
+
+    def __init__(
+        self,
+        path_provider: Callable[[], Path],
+        *,
+        rotation_check_seconds: float = 5.0,
+    ) -> None:
+        self._path_provider = path_provider
+        self._rotation_check_seconds = rotation_check_seconds
+        self._lock = threading.Lock()
+        self._subscribers: Set["queue.Queue[List[str]]"] = set()
+        self._thread: Optional[threading.Thread] = None
+
+    def subscribe(self) -> "queue.Queue[List[str]]":
+        """Register and return a queue that receives batches of appended lines."""
+
+        subscription: "queue.Queue[List[str]]" = queue.Queue(SUBSCRIBER_BACKLOG)
+        with self._lock:
+            self._subscribers.add(subscription)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="log-broadcaster", daemon=True
+                )
+                self._thread.start()
+        return subscription
+
+    def unsubscribe(self, subscription: "queue.Queue[List[str]]") -> None:
+        """Stop delivering lines to ``subscription``."""
+
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+    def _publish(self, lines: List[str]) -> None:
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for subscription in subscribers:
+            while True:
+                try:
+                    subscription.put_nowait(lines)
+                    break
+                except queue.Full:
+                    # Drop the oldest batch rather than block the tail loop.
+                    try:
+                        subscription.get_nowait()
+                    except queue.Empty:
+                        pass
+
+    def _has_subscribers(self) -> bool:
+        with self._lock:
+            if self._subscribers:
+                return True
+            self._thread = None
+            return False
+
+    def _run(self) -> None:
+        try:
+            self._tail()
+        except Exception as exc:  # noqa: BLE001
+            log_line(f"[LOGS] Log tailer stopped: {exc!r}")
+        finally:
+            # Let the next subscriber start a fresh tailer if this one died.
+            with self._lock:
+                if self._thread is threading.current_thread():
+                    self._thread = None
+
+    def _tail(self) -> None:
+        current_path = self._path_provider()
+        handle = _open_log(current_path, at_end=True)
+        watcher = LogWatcher(current_path)
+        last_path_check = time.monotonic()
+        try:
+            while self._has_subscribers():
+                now = time.monotonic()
+                if now - last_path_check >= self._rotation_check_seconds:
+                    last_path_check = now
+                    latest_path = self._path_provider()
+                    if latest_path != current_path:
+                        handle.close()
+                        current_path = latest_path
+                        # A rotated-to log is fresh, so publish it from the top.
+                        handle = _open_log(current_path, at_end=False)
+                        watcher.watch(current_path)
+
+                lines = handle.readlines()
+                if lines:
+                    self._publish(lines)
+                    continue
+
+                # A new run log shows up as activity on a sibling file; without
+                # inotify, fall back to the periodic path check above.
+                watcher.wait(self._rotation_check_seconds)
+                if watcher.sibling_changed():
+                    last_path_check = float("-inf")
+        finally:
+            watcher.close()
+            handle.close()
+
+
+def _open_log(path: Path, *, at_end: bool):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.touch(exist_ok=True)
+    handle = path.open("r", encoding="utf-8", errors="ignore")
+    if at_end:
+        handle.seek(0, os.SEEK_END)
+    return handle
+
+
+__all__ = ["LogBroadcaster", "LogWatcher", "FALLBACK_POLL_SECONDS"]
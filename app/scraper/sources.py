@@ -23,6 +23,13 @@ ALL_SOURCES = (UNREPORTED_JUDGMENTS, PUBLIC_REGISTERS)
 _DEFAULT_ALIASES = {"default", "unreported_judgments", "unreported-judgments", "uj", "unreported"}
 _PUBLIC_REGISTERS_ALIASES = {"public-registers", "public_registers", "pr"}
 
+# Every accepted spelling, lowercased, mapped to its canonical identifier so
+# normalisation is a single dict lookup.
+_SOURCE_ALIASES = {
+    **{alias: UNREPORTED_JUDGMENTS for alias in _DEFAULT_ALIASES},
+    **{alias: PUBLIC_REGISTERS for alias in _PUBLIC_REGISTERS_ALIASES},
+}
+
 # ``normalize_source`` is a pure mapper with no side effects. Prefer ``coerce_source``
 # when handling user-supplied or untrusted inputs so unknown values are logged and
 # safely coerced back to ``DEFAULT_SOURCE``.
@@ -37,16 +44,7 @@ def normalize_source(value: str | None) -> str:
 
     if not value:
         return DEFAULT_SOURCE
-
-    raw = value.strip().lower()
-    if raw in ALL_SOURCES:
-        return raw
-    if raw in _DEFAULT_ALIASES:
-        return UNREPORTED_JUDGMENTS
-    if raw in _PUBLIC_REGISTERS_ALIASES:
-        return PUBLIC_REGISTERS
-
-    return DEFAULT_SOURCE
+    return _SOURCE_ALIASES.get(value.strip().lower(), DEFAULT_SOURCE)
 
 
 def coerce_source(raw: str | None) -> str:
@@ -59,7 +57,8 @@ def coerce_source(raw: str | None) -> str:
     if not raw:
         return DEFAULT_SOURCE
 
-    normalized = normalize_source(raw)
-    if normalized == DEFAULT_SOURCE and raw.strip().lower() not in _DEFAULT_ALIASES:
+    normalized = _SOURCE_ALIASES.get(raw.strip().lower())
+    if normalized is None:
         LOGGER.warning("[SOURCES][WARN] Unknown source %r; using default.", raw)
+        return DEFAULT_SOURCE
     return normalized
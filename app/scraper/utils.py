@@ -1,23 +1,36 @@
 from __future__ import annotations
 
+import atexit
 import hashlib
 import json
 import logging
 import os
+import queue
 import re
 import shutil
 import sys
+import threading
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from stat import S_ISREG
+from typing import Any, Dict, List, Set, Tuple
 from urllib.parse import unquote_plus
-from zipfile import ZIP_DEFLATED, ZipFile
+from zipfile import ZIP_STORED, ZipFile
+
+import orjson
 
 from . import config
 
 LOGGER = logging.getLogger("bailiikc")
 _LOGGER_INITIALISED = False
 _CURRENT_LOG_FILE: Path = config.LOG_FILE
+_LOG_LISTENER: QueueListener | None = None
+# Per archive, the ``_pdf_dir_state`` it was built from.
+_LAST_ZIP_STATE: Dict[Path, Dict[str, Tuple[int, int]]] = {}
+_ZIP_LOCK = threading.Lock()
+# Storage layouts (see ``_storage_layout``) already created by ``ensure_dirs``.
+_READY_LAYOUTS: Set[Tuple[Path, ...]] = set()
 
 MAX_STEM_LEN = 150
 MAX_CASE_FILENAME_BASE = 180
@@ -35,11 +48,13 @@ def canon_fname(value: str | None) -> str:
 def _configure_logger(log_path: Path) -> None:
     """Configure the shared application logger to write to ``log_path``."""
 
-    global _LOGGER_INITIALISED, _CURRENT_LOG_FILE
+    global _LOGGER_INITIALISED, _CURRENT_LOG_FILE, _LOG_LISTENER
 
     ensure_dirs()
     log_path.parent.mkdir(parents=True, exist_ok=True)
 
+    # Stopping the listener first flushes records queued for the old file.
+    _stop_log_listener()
     for handler in list(LOGGER.handlers):
         LOGGER.removeHandler(handler)
         try:
@@ -58,15 +73,40 @@ def _configure_logger(log_path: Path) -> None:
     file_handler = logging.FileHandler(log_path, encoding="utf-8")
     file_handler.setFormatter(formatter)
 
+    # Callers (request threads included) only enqueue records; a listener
+    # thread does the stdout and file writes.
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    listener = QueueListener(log_queue, stream_handler, file_handler)
+
     LOGGER.setLevel(logging.INFO)
-    LOGGER.addHandler(stream_handler)
-    LOGGER.addHandler(file_handler)
+    LOGGER.addHandler(QueueHandler(log_queue))
     LOGGER.propagate = False
+    listener.start()
 
+    _LOG_LISTENER = listener
     _CURRENT_LOG_FILE = log_path
     _LOGGER_INITIALISED = True
 
 
+def _stop_log_listener() -> None:
+    """Drain queued log records and close the listener's handlers."""
+
+    global _LOG_LISTENER
+
+    listener, _LOG_LISTENER = _LOG_LISTENER, None
+    if listener is None:
+        return
+    listener.stop()
+    for handler in listener.handlers:
+        try:
+            handler.close()
+        except Exception:  # noqa: BLE001
+            continue
+
+
+atexit.register(_stop_log_listener)
+
+
 def _ensure_logger() -> None:
     """Initialise the logger lazily using the default log file."""
 
@@ -95,8 +135,28 @@ def get_current_log_path() -> Path:
     return _CURRENT_LOG_FILE
 
 
+def _storage_layout() -> Tuple[Path, ...]:
+    return (
+        config.DATA_DIR,
+        config.PDF_DIR,
+        config.LOG_DIR,
+        config.METADATA_FILE,
+        config.DOWNLOADS_LOG,
+        config.SUMMARY_FILE,
+    )
+
+
 def ensure_dirs() -> None:
-    """Ensure that the application's expected directory structure exists."""
+    """Ensure that the application's expected directory structure exists.
+
+    Only the first call for a given set of configured paths touches the
+    filesystem; ``reset_state`` forgets the layout after deleting files so
+    they are recreated.
+    """
+
+    layout = _storage_layout()
+    if layout in _READY_LAYOUTS:
+        return
 
     config.DATA_DIR.mkdir(parents=True, exist_ok=True)
     config.PDF_DIR.mkdir(parents=True, exist_ok=True)
@@ -108,8 +168,11 @@ def ensure_dirs() -> None:
             encoding="utf-8",
         )
 
-    config.DOWNLOADS_LOG.parent.mkdir(parents=True, exist_ok=True)
-    config.DOWNLOADS_LOG.touch(exist_ok=True)
+    if not config.DOWNLOADS_LOG.exists():
+        # Only create the file; touching an existing log would bump its mtime
+        # and invalidate caches keyed on it.
+        config.DOWNLOADS_LOG.parent.mkdir(parents=True, exist_ok=True)
+        config.DOWNLOADS_LOG.touch()
 
     if not config.SUMMARY_FILE.exists():
         config.SUMMARY_FILE.write_text(
@@ -117,6 +180,8 @@ def ensure_dirs() -> None:
             encoding="utf-8",
         )
 
+    _READY_LAYOUTS.add(layout)
+
 
 def log_line(message: str) -> None:
     """Write a timestamped log line to stdout and the active log file."""
@@ -383,9 +448,8 @@ def load_metadata() -> dict[str, Any]:
     ensure_dirs()
 
     try:
-        with config.METADATA_FILE.open("r", encoding="utf-8") as handle:
-            data = json.load(handle)
-    except (json.JSONDecodeError, FileNotFoundError):
+        data = orjson.loads(config.METADATA_FILE.read_bytes())
+    except (orjson.JSONDecodeError, FileNotFoundError):
         data = {"downloads": []}
 
     downloads = data.setdefault("downloads", [])
@@ -397,10 +461,7 @@ def load_metadata() -> dict[str, Any]:
 def save_metadata(meta: dict[str, Any]) -> None:
     """Persist metadata to disk atomically."""
     tmp_path = config.METADATA_FILE.with_suffix(".tmp")
-
-    with tmp_path.open("w", encoding="utf-8") as handle:
-        json.dump(meta, handle, indent=2)
-
+    tmp_path.write_bytes(orjson.dumps(meta, option=orjson.OPT_INDENT_2))
     tmp_path.replace(config.METADATA_FILE)
 
 
@@ -454,14 +515,17 @@ def has_local_pdf(meta_entry: dict[str, Any] | None) -> bool:
     if stored_name:
         candidate_paths.append(config.PDF_DIR / stored_name)
 
-    for path in candidate_paths:
-        try:
-            if path.is_file() and path.stat().st_size > 1024:
-                return True
-        except OSError:
-            continue
+    return any(_file_size(path) > 1024 for path in candidate_paths)
 
-    return False
+
+def _file_size(path: Path) -> int:
+    """Return the size of regular file ``path`` with one ``stat``, else -1."""
+
+    try:
+        stat = path.stat()
+    except OSError:
+        return -1
+    return stat.st_size if S_ISREG(stat.st_mode) else -1
 
 
 def is_duplicate(
@@ -498,7 +562,8 @@ def is_duplicate(
 
     for path in candidate_paths:
         try:
-            if path.is_file() and path.stat().st_size > 1024:
+            size = _file_size(path)
+            if size > 1024:
                 entry.update(
                     {
                         "slug": slug or entry.get("slug") or fid,
@@ -507,7 +572,7 @@ def is_duplicate(
                         "filename": path.name,
                         "local_path": str(path.resolve()),
                         "downloaded": True,
-                        "filesize": path.stat().st_size,
+                        "filesize": size,
                         "downloaded_at": datetime.utcnow().isoformat(timespec="seconds")
                         + "Z",
                     }
@@ -595,21 +660,65 @@ def record_result(
 def list_pdfs() -> list[Path]:
     """Return all PDF files currently stored in the PDF directory."""
     ensure_dirs()
-    return sorted(
-        p for p in config.PDF_DIR.glob("*.pdf")
-        if p.is_file()
-    )
+    with os.scandir(config.PDF_DIR) as entries:
+        return sorted(
+            Path(entry.path)
+            for entry in entries
+            if entry.name.endswith(".pdf") and entry.is_file()
+        )
+
+
+def _pdf_dir_state() -> Dict[str, Tuple[int, int]]:
+    """Return ``{name: (size, mtime_ns)}`` for PDFs in the PDF directory."""
+
+    state: Dict[str, Tuple[int, int]] = {}
+    with os.scandir(config.PDF_DIR) as entries:
+        for entry in entries:
+            if not entry.name.endswith(".pdf") or not entry.is_file():
+                continue
+            stat = entry.stat()
+            state[entry.name] = (stat.st_size, stat.st_mtime_ns)
+    return state
 
 
 def build_zip(zip_name: str = config.ZIP_NAME) -> Path:
-    """Create a ZIP archive containing all downloaded PDFs."""
+    """Create a ZIP archive containing all downloaded PDFs.
+
+    The archive is reused while no PDF has been added, removed or modified
+    since it was last built. When PDFs have only been added, the previous
+    archive is copied and just the new files are appended; otherwise it is
+    rebuilt. PDFs are stored uncompressed, as deflating them gains almost
+    nothing. A new archive is swapped in atomically, so downloads already
+    streaming the old one are unaffected.
+    """
     ensure_dirs()
     archive_path = config.DATA_DIR / zip_name
+    with _ZIP_LOCK:
+        state = _pdf_dir_state()
+        previous = _LAST_ZIP_STATE.get(archive_path)
+        archive_exists = archive_path.exists()
+        if archive_exists and previous == state:
+            return archive_path
+
+        tmp_path = archive_path.with_name(archive_path.name + ".tmp")
+        if (
+            archive_exists
+            and previous is not None
+            and all(state.get(name) == meta for name, meta in previous.items())
+        ):
+            shutil.copyfile(archive_path, tmp_path)
+            mode = "a"
+            names = sorted(name for name in state if name not in previous)
+        else:
+            mode = "w"
+            names = sorted(state)
 
-    with ZipFile(archive_path, "w", ZIP_DEFLATED) as archive:
-        for pdf_path in list_pdfs():
-            archive.write(pdf_path, pdf_path.name)
+        with ZipFile(tmp_path, mode, ZIP_STORED) as archive:
+            for name in names:
+                archive.write(config.PDF_DIR / name, name)
+        tmp_path.replace(archive_path)
 
+        _LAST_ZIP_STATE[archive_path] = state
     return archive_path
 
 
@@ -679,6 +788,7 @@ def reset_state(*, delete_pdfs: bool = False, delete_logs: bool = False) -> None
                 pass
 
     # Recreate required files and reset logger to a clean default file.
+    _READY_LAYOUTS.discard(_storage_layout())
     ensure_dirs()
     _configure_logger(config.LOG_FILE)
 
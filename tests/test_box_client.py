@@ -1,3 +1,4 @@
+import io
 from pathlib import Path
 
 import pytest
@@ -14,6 +15,13 @@ class _FakeResponseBase:
         return False
 
 
+class _Raw(io.BytesIO):
+    """Stand-in for ``Response.raw`` that hands out a few bytes per read."""
+
+    def read(self, size=-1):  # noqa: ANN001
+        return super().read(3 if size is None or size < 0 else min(size, 3))
+
+
 def _valid_pdf_bytes() -> bytes:
     return b"%PDF-1.4\n" + b"0" * box_client.MIN_PDF_BYTES
 
@@ -57,10 +65,9 @@ def test_download_pdf_with_requests(monkeypatch: pytest.MonkeyPatch, tmp_path: P
         def raise_for_status(self):
             return None
 
-        def iter_content(self, chunk_size=8192):  # noqa: ANN001
-            yield _valid_pdf_bytes()
+        raw = _Raw(_valid_pdf_bytes())
 
-    monkeypatch.setattr(box_client.requests, "get", lambda *_, **__: Resp())
+    monkeypatch.setattr(box_client._SESSION, "get", lambda *_, **__: Resp())
 
     dest = tmp_path / "file.pdf"
     result = box_client.download_pdf("https://example.com/file.pdf", dest)
@@ -84,10 +91,9 @@ def test_download_pdf_http_error(monkeypatch: pytest.MonkeyPatch, tmp_path: Path
         def raise_for_status(self):
             raise requests.HTTPError("500")
 
-        def iter_content(self, chunk_size=8192):  # noqa: ANN001
-            yield _valid_pdf_bytes()
+        raw = _Raw(_valid_pdf_bytes())
 
-    monkeypatch.setattr(box_client.requests, "get", lambda *_, **__: Resp())
+    monkeypatch.setattr(box_client._SESSION, "get", lambda *_, **__: Resp())
 
     dest = tmp_path / "file.pdf"
     with pytest.raises(box_client.DownloadError) as excinfo:
@@ -98,6 +104,45 @@ def test_download_pdf_http_error(monkeypatch: pytest.MonkeyPatch, tmp_path: Path
     assert dest.exists() is False
 
 
+def test_download_pdf_retries_body_read_failures_as_network_errors(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    import urllib3
+
+    monkeypatch.setattr(box_client, "log_line", lambda msg: None)
+    monkeypatch.setattr(box_client.time, "sleep", lambda seconds: None)
+
+    class _DroppedRaw(_Raw):
+        """Serve the PDF header, then fail as a dropped connection would."""
+
+        def read(self, size=-1):  # noqa: ANN001
+            if self.tell() >= 8:
+                raise urllib3.exceptions.ProtocolError("Connection broken")
+            return super().read(size)
+
+    attempts = []
+
+    class Resp(_FakeResponseBase):
+        status_code = 200
+
+        def __init__(self) -> None:
+            attempts.append(1)
+            self.raw = _DroppedRaw(_valid_pdf_bytes())
+
+        def raise_for_status(self):
+            return None
+
+    monkeypatch.setattr(box_client._SESSION, "get", lambda *_, **__: Resp())
+
+    dest = tmp_path / "file.pdf"
+    with pytest.raises(box_client.DownloadError) as excinfo:
+        box_client.download_pdf("https://example.com/file.pdf", dest, max_retries=3)
+
+    assert excinfo.value.error_code == ErrorCode.NETWORK
+    assert len(attempts) == 3
+    assert dest.exists() is False
+
+
 @pytest.mark.parametrize(
     "chunks, expected_error_code",
     [([b"HTML"], ErrorCode.MALFORMED_PDF), ([b"%PDF"], ErrorCode.MALFORMED_PDF)],
@@ -115,10 +160,9 @@ def test_download_pdf_invalid_content(
         def raise_for_status(self):
             return None
 
-        def iter_content(self, chunk_size=8192):  # noqa: ANN001
-            yield from chunks
+        raw = _Raw(b"".join(chunks))
 
-    monkeypatch.setattr(box_client.requests, "get", lambda *_, **__: Resp())
+    monkeypatch.setattr(box_client._SESSION, "get", lambda *_, **__: Resp())
 
     dest = tmp_path / "file.pdf"
     with pytest.raises(box_client.DownloadError) as excinfo:
@@ -127,3 +171,66 @@ def test_download_pdf_invalid_content(
     assert excinfo.value.error_code == expected_error_code
     assert dest.exists() is False
     assert any("failed" in msg.lower() for msg in messages)
+
+
+def test_download_pdf_uses_injected_session(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setattr(box_client, "log_line", lambda msg: None)
+
+    class Resp(_FakeResponseBase):
+        status_code = 200
+
+        def raise_for_status(self):
+            return None
+
+        raw = _Raw(_valid_pdf_bytes())
+
+    calls = []
+
+    class Session:
+        def get(self, url, **kwargs):  # noqa: ANN001, ANN003
+            calls.append((url, kwargs["stream"]))
+            return Resp()
+
+    monkeypatch.setattr(
+        box_client._SESSION, "get", lambda *_, **__: pytest.fail("shared session used")
+    )
+
+    dest = tmp_path / "file.pdf"
+    result = box_client.download_pdf("https://example.com/file.pdf", dest, session=Session())
+
+    assert result.ok is True
+    assert calls == [("https://example.com/file.pdf", True)]
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        ("https://example.com/file.pdf?token=secret", "https://example.com/file.pdf"),
+        ("https://example.com/file.pdf?token=secret#page=2", "https://example.com/file.pdf"),
+        ("https://example.com/file.pdf", "https://example.com/file.pdf"),
+    ],
+)
+def test_redact_url_strips_query_and_fragment(url: str, expected: str) -> None:
+    assert box_client._redact_url(url) == expected
+
+
+def test_download_pdf_creates_missing_destination_dir(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.setattr(box_client, "log_line", lambda msg: None)
+
+    class Resp(_FakeResponseBase):
+        status_code = 200
+
+        def raise_for_status(self):
+            return None
+
+        raw = _Raw(_valid_pdf_bytes())
+
+    monkeypatch.setattr(box_client._SESSION, "get", lambda *_, **__: Resp())
+
+    dest = tmp_path / "missing" / "file.pdf"
+    result = box_client.download_pdf("https://example.com/file.pdf", dest)
+
+    assert result.ok is True
+    assert dest.read_bytes() == _valid_pdf_bytes()
@@ -132,3 +132,35 @@ def test_find_case_by_fname_public_registers(
 
     legacy = cases_index.find_case_by_fname("NOTARIESPUBLICNP1")
     assert legacy is None
+
+
+def test_find_case_by_fname_source_lookup_keeps_first_loaded_match() -> None:
+    cases_index._reset_indexes()
+    rows = [
+        cases_index.CaseRow(action="NPREGISTER2", code="NP2", suffix="", title="second"),
+        cases_index.CaseRow(action="NPREGISTER1", code="NP1", suffix="", title="first"),
+        cases_index.CaseRow(action="NP1", code="OTHER", suffix="", title="action"),
+    ]
+    cases_index.CASES_BY_SOURCE[sources.PUBLIC_REGISTERS] = list(rows)
+
+    def lookup(fname: str, strict: bool = False):  # noqa: ANN202
+        return cases_index.find_case_by_fname(
+            fname, strict=strict, source=sources.PUBLIC_REGISTERS
+        )
+
+    try:
+        assert lookup("np1") is rows[1]
+        assert lookup("NPREGISTER") is rows[0]
+        assert lookup("NPREGISTER", strict=True) is None
+
+        added = cases_index.CaseRow(action="NPEXTRA", code="NPX", suffix="", title="added")
+        cases_index.CASES_BY_SOURCE[sources.PUBLIC_REGISTERS].append(added)
+        assert lookup("NPX") is added
+
+        # Same length, different list: the lookups must be rebuilt.
+        swapped = cases_index.CaseRow(action="NPSWAP", code="NPS", suffix="", title="swap")
+        cases_index.CASES_BY_SOURCE[sources.PUBLIC_REGISTERS] = [swapped, *rows]
+        assert lookup("NPS") is swapped
+        assert lookup("NPX") is None
+    finally:
+        cases_index._reset_indexes()
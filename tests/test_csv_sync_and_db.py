@@ -172,6 +172,25 @@ def test_run_lifecycle_logging(tmp_path: Path, monkeypatch: pytest.MonkeyPatch)
     assert failed["error_summary"] == "boom"
 
 
+def test_schema_enables_wal_and_data_version_tracks_commits(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _configure_temp_paths(tmp_path, monkeypatch)
+    db.initialize_schema()
+
+    conn = db.get_connection()
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+
+    before = db.data_version()
+    assert db.data_version() == before
+
+    db.create_run(trigger="cli", mode="full", csv_version_id=1, params_json="{}")
+    after = db.data_version()
+    assert after != before
+    assert db.data_version() == after
+
+
 def test_normalize_action_token_alignment() -> None:
     tokens = [
         "FSD0151 2025/11/06-2025 atp life science",
@@ -182,3 +201,29 @@ def test_normalize_action_token_alignment() -> None:
 
     for token in tokens:
         assert cases_index.normalize_action_token(token) == csv_sync.normalize_action_token(token)
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        ("fsd0151202511062025atp", "FSD0151202511062025ATP"),
+        ("FSD&amp;0151", "FSD0151"),
+        ("FSD%200151+2025", "FSD01512025"),
+        ("FSD\u00a00151\tX", "FSD0151X"),
+        ("   ", ""),
+        (None, ""),
+    ],
+)
+def test_normalize_action_token_fast_and_slow_paths(raw: str, expected: str) -> None:
+    assert cases_index.normalize_action_token(raw) == expected
+
+
+def test_normalize_action_token_is_memoised_until_index_reset() -> None:
+    cases_index.normalize_action_token.cache_clear()
+
+    cases_index.normalize_action_token("FSD%200151")
+    cases_index.normalize_action_token("FSD%200151")
+    assert cases_index.normalize_action_token.cache_info().hits == 1
+
+    cases_index._reset_indexes()
+    assert cases_index.normalize_action_token.cache_info().currsize == 0
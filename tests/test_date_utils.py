@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import pytest
+
+from app.scraper.date_utils import sortable_date
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        ("2024-01-05", "2024-01-05"),
+        (" 2024-01-05 ", "2024-01-05"),
+        ("2025-Nov-06", "2025-11-06"),
+        ("06/11/2025", "2025-11-06"),
+        ("06-Nov-2025", "2025-11-06"),
+        ("20240105", "2024-01-05"),
+        ("2024-13-45", "2024-13-45"),
+        ("２０２４-01-05", "2024-01-05"),
+        ("Judgment 2024.01.05", "2024-01-05"),
+        ("", ""),
+        ("   ", ""),
+        ("no date here", ""),
+        ("2024", ""),
+        ("1/2/345", ""),
+    ],
+)
+def test_sortable_date_normalises_known_formats(raw: str, expected: str) -> None:
+    assert sortable_date(raw) == expected
+
+
+def test_sortable_date_is_memoised() -> None:
+    sortable_date.cache_clear()
+
+    sortable_date("2024-Feb-29")
+    sortable_date("2024-Feb-29")
+
+    info = sortable_date.cache_info()
+    assert info.hits == 1
+    assert info.misses == 1
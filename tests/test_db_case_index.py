@@ -1,3 +1,4 @@
+import io
 import sys
 from pathlib import Path
 from typing import Optional
@@ -94,3 +95,146 @@ def test_db_index_matches_csv_index(tmp_path: Path, monkeypatch: pytest.MonkeyPa
         assert csv_case.court == db_case["court"]
         assert csv_case.category == db_case["category"]
         assert csv_case.judgment_date == db_case["judgment_date"]
+
+
+def test_load_cases_from_csv_resolves_fallback_columns(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("BAILIIKC_USE_DB_CASES", "0")
+    sample_csv = tmp_path / "judgments.csv"
+    sample_csv.write_text(
+        "Action,Case Title,Court file,Date,Cause No.\n"
+        "\n"
+        "FSD0151202511062025ATP,Re ATP,FSD 0151 OF 2025,2025-Nov-06,FSD 151/2025\n"
+        "G0237202311052025STRATA|G0238202311052025STRATA,  Strata v Dixon  \n"
+        ",No actions here,,,\n",
+        encoding="utf-8",
+    )
+
+    cases_index.load_cases_from_csv(str(sample_csv))
+
+    first = cases_index.CASES_BY_ACTION["FSD0151202511062025ATP"]
+    assert first.title == "Re ATP"
+    assert first.subject == "Re ATP"
+    assert first.court == "FSD 0151 OF 2025"
+    assert first.judgment_date == "2025-Nov-06"
+    assert first.cause_number == "FSD 151/2025"
+    assert first.extra["Cause No."] == "FSD 151/2025"
+
+    short = cases_index.CASES_BY_ACTION["G0238202311052025STRATA"]
+    assert short.title == "Strata v Dixon"
+    assert short.court == ""
+    assert short.extra["Date"] == ""
+    assert short.extra is cases_index.CASES_BY_ACTION["G0237202311052025STRATA"].extra
+    assert len(cases_index.CASES_ALL) == 3
+
+
+def test_find_case_by_fname_partial_matches_use_ngram_index(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("BAILIIKC_USE_DB_CASES", "0")
+    sample_csv = tmp_path / "judgments.csv"
+    sample_csv.write_text(
+        "Title,Actions\n"
+        "ATP,FSD0151202511062025ATPLIFESCIENCE\n"
+        "Strata,G0237202311052025STRATA647\n"
+        "Short,AG13\n",
+        encoding="utf-8",
+    )
+    cases_index.load_cases_from_csv(str(sample_csv))
+
+    # Candidate inside an action, found through the n-gram postings.
+    assert cases_index.find_case_by_fname("ATPLIFESCI").title == "ATP"
+    # Action inside a longer candidate.
+    assert cases_index.find_case_by_fname("xxG0237202311052025STRATA647yy").title == "Strata"
+    # Candidates shorter than an n-gram still match.
+    assert cases_index.find_case_by_fname("ag1").title == "Short"
+    assert cases_index.find_case_by_fname("ZZZZZZZZ") is None
+
+    cases_index.AJAX_FNAME_INDEX["NEWACTIONTOKEN"] = cases_index.CASES_ALL[0]
+    assert cases_index.find_case_by_fname("ACTIONTOK") is cases_index.CASES_ALL[0]
+
+
+def test_load_cases_from_csv_streams_url_through_shared_session(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("BAILIIKC_USE_DB_CASES", "0")
+    body = "﻿Title,Actions\nRe ATP,FSD0151202511062025ATP\n".encode("utf-8")
+    calls = []
+
+    class _Response:
+        def __init__(self) -> None:
+            self.raw = io.BytesIO(body)
+
+        def raise_for_status(self) -> None:
+            return None
+
+    def fake_get(url: str, **kwargs: object) -> _Response:
+        calls.append((url, kwargs))
+        return _Response()
+
+    monkeypatch.setattr(cases_index._CSV_SESSION, "get", fake_get)
+
+    cases_index.load_cases_from_csv("https://example.test/judgments.csv")
+
+    assert calls[0][1]["stream"] is True
+    assert cases_index.CASES_BY_ACTION["FSD0151202511062025ATP"].title == "Re ATP"
+
+
+def test_load_cases_from_csv_keeps_index_when_stream_breaks(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import urllib3
+
+    monkeypatch.setenv("BAILIIKC_USE_DB_CASES", "0")
+    sample_csv = tmp_path / "judgments.csv"
+    sample_csv.write_text("Title,Actions\nRe ATP,FSD0151202511062025ATP\n", encoding="utf-8")
+    cases_index.load_cases_from_csv(str(sample_csv))
+
+    class _BrokenRaw(io.BytesIO):
+        """Return the header and one row, then drop the connection."""
+
+        def read1(self, size: int = -1) -> bytes:
+            if self.tell():
+                raise urllib3.exceptions.ProtocolError("Connection broken")
+            return super().read1(size)
+
+        read = read1
+
+    raw = _BrokenRaw(b"Title,Actions\nStrata,G0237202311052025STRATA\n")
+
+    class _Response:
+        def __init__(self) -> None:
+            self.raw = raw
+
+        def raise_for_status(self) -> None:
+            return None
+
+    monkeypatch.setattr(cases_index._CSV_SESSION, "get", lambda url, **kwargs: _Response())
+
+    cases_index.load_cases_from_csv("https://example.test/judgments.csv")
+
+    assert raw.closed
+    assert list(cases_index.CASES_BY_ACTION) == ["FSD0151202511062025ATP"]
+    assert [case.title for case in cases_index.CASES_ALL] == ["Re ATP"]
+    assert cases_index.find_case_by_fname("G0237202311052025STRATA") is None
+
+
+def test_resolve_csv_stream_closes_response_on_http_error(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import requests
+
+    closed = []
+
+    class _Response:
+        def raise_for_status(self) -> None:
+            raise requests.HTTPError("503 Server Error")
+
+        def close(self) -> None:
+            closed.append(True)
+
+    monkeypatch.setattr(cases_index._CSV_SESSION, "get", lambda url, **kwargs: _Response())
+
+    assert cases_index._resolve_csv_stream("https://example.test/judgments.csv") == (None, None)
+    assert closed == [True]
@@ -193,3 +193,78 @@ def test_api_db_downloaded_cases_filters_by_source(
     payload = resp.get_json()
     assert len(payload["data"]) == 1
     assert payload["data"][0]["source"] == "public_registers"
+
+
+@pytest.mark.parametrize(
+    "path_template", ["/api/db/runs/{run_id}/downloaded-cases", "/api/db/downloaded-cases"]
+)
+def test_api_db_downloaded_cases_answer_304_until_db_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, path_template: str
+) -> None:
+    _configure_temp_paths(tmp_path, monkeypatch)
+    db.initialize_schema()
+
+    run_id, csv_version_id = _create_run_with_version()
+    _seed_downloaded_case(csv_version_id, run_id)
+
+    main = _reload_main_module()
+    client = main.app.test_client()
+    path = path_template.format(run_id=run_id)
+
+    first = client.get(path)
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+
+    cached = client.get(path, headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.data == b""
+
+    db.mark_run_completed(run_id)
+    refreshed = client.get(path, headers={"If-None-Match": etag})
+    assert refreshed.status_code == 200
+    assert refreshed.headers["ETag"] != etag
+
+
+def test_api_downloaded_cases_streams_keyset_pages(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _configure_temp_paths(tmp_path, monkeypatch)
+    monkeypatch.setenv("BAILIIKC_USE_DB_REPORTING", "1")
+    db.initialize_schema()
+
+    run_id, csv_version_id = _create_run_with_version()
+    conn = db.get_connection()
+    with conn:
+        ts = "2024-01-02T00:00:00Z"
+        for suffix in ("A", "B", "C"):
+            case_id = _insert_case_with_source(
+                conn, csv_version_id, source="unreported_judgments", token_suffix=suffix
+            )
+            conn.execute(
+                """
+                INSERT INTO downloads (
+                    run_id, case_id, status, attempt_count, last_attempt_at, file_path,
+                    file_size_bytes, box_url_last, error_code, error_message, created_at,
+                    updated_at
+                ) VALUES (?, ?, 'downloaded', 1, ?, 'pdfs/dummy.pdf', 100, NULL, NULL, NULL, ?, ?)
+                """,
+                (run_id, case_id, ts, ts, ts),
+            )
+
+    main = _reload_main_module()
+    client = main.app.test_client()
+
+    first = client.get("/api/downloaded-cases?limit=2")
+    assert first.status_code == 200
+    assert first.is_streamed
+    page = first.get_json()
+    assert [row["actions_token"] for row in page["data"]] == ["NORM-A", "NORM-B"]
+    assert page["next_after_id"] is not None
+
+    second = client.get(f"/api/downloaded-cases?limit=2&after_id={page['next_after_id']}")
+    rest = second.get_json()
+    assert [row["actions_token"] for row in rest["data"]] == ["NORM-C"]
+    assert rest["next_after_id"] is None
+
+    full = client.get("/api/downloaded-cases").get_json()
+    assert full["data"] == page["data"] + rest["data"]
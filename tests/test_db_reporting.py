@@ -267,3 +267,34 @@ def test_get_run_coverage_respects_source(
     summary = db_reporting.get_run_coverage(run_id)
     assert summary["cases_total"] == 1
     assert summary["cases_planned"] == 1
+
+
+@pytest.mark.parametrize("status_filter", [None, "downloaded"])
+def test_get_download_facets_for_run_matches_rows(
+    populated_runs_and_downloads_db: dict, status_filter: Optional[str]
+) -> None:
+    run_id = populated_runs_and_downloads_db["run_id"]
+    rows = db_reporting.get_download_rows_for_run(run_id, status_filter=status_filter)
+
+    facets = db_reporting.get_download_facets_for_run(run_id, status_filter=status_filter)
+
+    assert facets["count"] == len(rows)
+    assert facets["courts"] == sorted({row["court"] for row in rows if row["court"]})
+    assert facets["categories"] == sorted(
+        {row["category"] for row in rows if row["category"]}
+    )
+
+
+def test_get_download_facets_for_run_without_runs(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    db_path = tmp_path / "empty.db"
+    monkeypatch.setattr(config, "DB_PATH", db_path)
+    monkeypatch.setattr(db, "DB_PATH", db_path)
+    db.initialize_schema()
+
+    assert db_reporting.get_download_facets_for_run() == {
+        "count": 0,
+        "courts": [],
+        "categories": [],
+    }
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import gzip
+import json
 from pathlib import Path
 
 import pytest
@@ -148,3 +150,38 @@ def test_api_downloaded_cases_filters_by_source(
         tokens["unknown"],
     }
     assert all(row["source"] == sources.UNREPORTED_JUDGMENTS for row in unknown_data)
+
+
+def test_api_downloaded_cases_is_gzipped_when_accepted(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _configure_temp_paths(tmp_path, monkeypatch)
+    from app.scraper import config
+
+    monkeypatch.setenv("BAILIIKC_USE_DB_REPORTING", "0")
+    config.DOWNLOADS_LOG.parent.mkdir(parents=True, exist_ok=True)
+    with config.DOWNLOADS_LOG.open("w", encoding="utf-8") as handle:
+        for index in range(50):
+            handle.write(
+                json.dumps({"actions_token": f"TOK-{index}", "title": f"Case {index}"})
+                + "\n"
+            )
+    main = _reload_main_module()
+    client = main.app.test_client()
+
+    plain = client.get("/api/downloaded-cases")
+    assert "Content-Encoding" not in plain.headers
+    assert "Accept-Encoding" in plain.headers["Vary"]
+
+    resp = client.get("/api/downloaded-cases", headers={"Accept-Encoding": "gzip"})
+
+    assert resp.headers["Content-Encoding"] == "gzip"
+    assert len(resp.data) < len(plain.data)
+    assert gzip.decompress(resp.data) == plain.data
+    assert resp.headers["ETag"] == plain.headers["ETag"]
+
+    cached = client.get(
+        "/api/downloaded-cases",
+        headers={"Accept-Encoding": "gzip", "If-None-Match": resp.headers["ETag"]},
+    )
+    assert cached.status_code == 304
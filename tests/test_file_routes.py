@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from tests.test_runs_api_db import _configure_temp_paths, _reload_main_module
+
+
+def test_download_file_serves_pdf_inside_pdf_dir(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _configure_temp_paths(tmp_path, monkeypatch)
+    main = _reload_main_module()
+    from app.scraper import config
+
+    config.PDF_DIR.mkdir(parents=True, exist_ok=True)
+    (config.PDF_DIR / "case.pdf").write_bytes(b"%PDF-1.4")
+
+    resp = main.app.test_client().get("/files/case.pdf")
+
+    assert resp.status_code == 200
+    assert resp.data == b"%PDF-1.4"
+    resp.close()
+
+
+def test_download_file_rejects_sibling_directory_with_shared_prefix(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _configure_temp_paths(tmp_path, monkeypatch)
+    main = _reload_main_module()
+    from app.scraper import config
+
+    sibling = config.PDF_DIR.parent / f"{config.PDF_DIR.name}_evil"
+    sibling.mkdir(parents=True, exist_ok=True)
+    (sibling / "secret.pdf").write_bytes(b"secret")
+
+    with main.app.test_request_context():
+        resp = main.download_file(f"../{sibling.name}/secret.pdf")
+
+    assert resp.status_code == 400
+
+
+def test_download_log_rejects_traversal(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _configure_temp_paths(tmp_path, monkeypatch)
+    main = _reload_main_module()
+
+    with main.app.test_request_context():
+        resp = main.download_log("../metadata.json")
+
+    assert resp.status_code == 400
+
+
+@pytest.mark.parametrize("filename", ["/etc/passwd", "sub/../../metadata.json"])
+def test_download_file_rejects_absolute_and_parent_segments_before_resolving(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, filename: str
+) -> None:
+    _configure_temp_paths(tmp_path, monkeypatch)
+    main = _reload_main_module()
+
+    def _fail_resolve(self, strict=False):
+        raise AssertionError("path should be rejected before resolve()")
+
+    with main.app.test_request_context():
+        monkeypatch.setattr(Path, "resolve", _fail_resolve)
+        resp = main.download_file(filename)
+
+    assert resp.status_code == 400
+
+
+def test_download_file_rejects_symlink_escaping_pdf_dir(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _configure_temp_paths(tmp_path, monkeypatch)
+    main = _reload_main_module()
+    from app.scraper import config
+
+    outside = tmp_path / "outside.pdf"
+    outside.write_bytes(b"secret")
+    config.PDF_DIR.mkdir(parents=True, exist_ok=True)
+    (config.PDF_DIR / "link.pdf").symlink_to(outside)
+
+    resp = main.app.test_client().get("/files/link.pdf")
+
+    assert resp.status_code == 400
+
+
+def test_download_log_rejects_sibling_directory_with_shared_prefix(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _configure_temp_paths(tmp_path, monkeypatch)
+    main = _reload_main_module()
+    from app.scraper import config
+
+    sibling = config.LOG_DIR.parent / f"{config.LOG_DIR.name}_old"
+    sibling.mkdir(parents=True, exist_ok=True)
+    (sibling / "scrape.log").write_text("secret", encoding="utf-8")
+
+    with main.app.test_request_context():
+        resp = main.download_log(f"../{sibling.name}/scrape.log")
+
+    assert resp.status_code == 400
+
+
+def test_download_file_delegates_to_proxy_when_configured(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _configure_temp_paths(tmp_path, monkeypatch)
+    main = _reload_main_module()
+    from app.scraper import config
+
+    monkeypatch.setattr(config, "X_ACCEL_REDIRECT_PREFIX", "/_protected")
+    config.PDF_DIR.mkdir(parents=True, exist_ok=True)
+    (config.PDF_DIR / "Café case.pdf").write_bytes(b"%PDF-1.4")
+
+    resp = main.app.test_client().get("/files/Café case.pdf")
+
+    assert resp.status_code == 200
+    assert resp.data == b""
+    assert resp.mimetype == "application/pdf"
+    assert resp.headers["X-Accel-Redirect"] == "/_protected/pdfs/Caf%C3%A9%20case.pdf"
+    disposition = resp.headers["Content-Disposition"]
+    assert disposition.startswith("attachment")
+    assert "filename*=UTF-8''Caf%C3%A9%20case.pdf" in disposition
+
+
+def test_download_all_zip_uses_x_sendfile_when_enabled(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _configure_temp_paths(tmp_path, monkeypatch)
+    from app.scraper import config
+
+    monkeypatch.setattr(config, "USE_X_SENDFILE", True)
+    main = _reload_main_module()
+    config.PDF_DIR.mkdir(parents=True, exist_ok=True)
+    (config.PDF_DIR / "one.pdf").write_bytes(b"%PDF-1")
+
+    resp = main.app.test_client().get("/download/all.zip")
+
+    assert resp.status_code == 200
+    assert resp.headers["X-Sendfile"] == str(config.DATA_DIR / config.ZIP_NAME)
+    assert resp.data == b""
+
+
+def test_download_all_zip_answers_304_while_pdfs_are_unchanged(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _configure_temp_paths(tmp_path, monkeypatch)
+    main = _reload_main_module()
+    from app.scraper import config
+
+    config.PDF_DIR.mkdir(parents=True, exist_ok=True)
+    (config.PDF_DIR / "one.pdf").write_bytes(b"%PDF-1")
+    client = main.app.test_client()
+
+    first = client.get("/download/all.zip")
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+    assert first.headers["Last-Modified"]
+    first.close()
+
+    cached = client.get("/download/all.zip", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.data == b""
+
+    since = client.get(
+        "/download/all.zip",
+        headers={"If-Modified-Since": first.headers["Last-Modified"]},
+    )
+    assert since.status_code == 304
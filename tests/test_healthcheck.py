@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import threading
+import time
 from pathlib import Path
 import pytest
 
@@ -50,9 +52,47 @@ def test_health_api_reports_status(tmp_path: Path, monkeypatch: pytest.MonkeyPat
     assert "filesystem" in payload["checks"]
 
     monkeypatch.setattr(db, "initialize_schema", lambda: (_ for _ in ()).throw(RuntimeError("db error")))
+    # Let the cached healthy result expire.
+    monkeypatch.setattr(main, "_HEALTH_STATE", None)
 
     resp_unhealthy = client.get("/api/health")
     assert resp_unhealthy.status_code == 503
     data_unhealthy = resp_unhealthy.get_json()
     assert data_unhealthy["ok"] is False
     assert data_unhealthy["checks"]["database"]["ok"] is False
+
+
+def test_health_api_shares_one_check_between_concurrent_probes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _configure_temp_paths(tmp_path, monkeypatch)
+    main = _reload_main_module()
+    release = threading.Event()
+    calls: list[str] = []
+
+    def _slow_check(entrypoint: str = "cli") -> healthcheck.HealthResult:
+        calls.append(entrypoint)
+        release.wait(5.0)
+        return healthcheck.HealthResult(ok=True, checks={"config": {"ok": True}})
+
+    monkeypatch.setattr(main, "run_health_checks", _slow_check)
+
+    statuses: list[int] = []
+
+    def _probe() -> None:
+        statuses.append(main.app.test_client().get("/api/health").status_code)
+
+    probes = [threading.Thread(target=_probe) for _ in range(4)]
+    for probe in probes:
+        probe.start()
+    while main._HEALTH_PENDING is None:
+        time.sleep(0.01)
+    release.set()
+    for probe in probes:
+        probe.join(5.0)
+
+    resp = main.app.test_client().get("/api/health")
+
+    assert statuses == [200, 200, 200, 200]
+    assert resp.headers["Cache-Control"] == "max-age=2"
+    assert calls == ["ui"]
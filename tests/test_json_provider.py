@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+from app.json_provider import OrjsonProvider
+
+
+def _payload() -> dict[str, object]:
+    return {
+        "zeta": [1, 2.5, None, True],
+        "alpha": {"b": "Café", "a": 1},
+        "when": datetime(2024, 3, 2, 10, 30, tzinfo=timezone.utc),
+    }
+
+
+def test_orjson_provider_matches_default_provider_semantics() -> None:
+    app = Flask(__name__)
+    expected = json.loads(DefaultJSONProvider(app).response(_payload()).get_data())
+
+    app.json = OrjsonProvider(app)
+    with app.app_context():
+        resp = app.json.response(_payload())
+
+    assert resp.mimetype == "application/json"
+    body = resp.get_data()
+    assert body.endswith(b"\n")
+    assert json.loads(body) == expected
+    assert list(json.loads(body)) == ["alpha", "when", "zeta"]
+    assert expected["when"] == "Sat, 02 Mar 2024 10:30:00 GMT"
+
+
+def test_orjson_provider_indents_in_debug_mode() -> None:
+    app = Flask(__name__)
+    app.debug = True
+    app.json = OrjsonProvider(app)
+
+    body = app.json.response({"a": 1}).get_data(as_text=True)
+
+    assert body == '{\n  "a": 1\n}\n'
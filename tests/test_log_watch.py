@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from app.scraper import log_watch
+from app.scraper.log_watch import LogBroadcaster, LogWatcher
+
+
+def test_log_watcher_wakes_on_write(tmp_path: Path) -> None:
+    log_path = tmp_path / "latest.log"
+    log_path.touch()
+
+    with LogWatcher(log_path) as watcher:
+        if not watcher.uses_inotify:
+            pytest.skip("inotify is not available on this platform")
+
+        assert watcher.wait(0.05) is False
+
+        timer = threading.Timer(0.1, lambda: log_path.write_text("line\n"))
+        timer.start()
+        started = time.monotonic()
+        assert watcher.wait(5.0) is True
+        assert time.monotonic() - started < 4.0
+        timer.join()
+
+
+def test_log_watcher_falls_back_to_sleep(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(log_watch, "_LIBC", None)
+    monkeypatch.setattr(log_watch, "FALLBACK_POLL_SECONDS", 0.01)
+
+    with LogWatcher(tmp_path / "latest.log") as watcher:
+        assert watcher.uses_inotify is False
+        assert watcher.wait(30.0) is True
+
+
+def test_log_broadcaster_fans_out_to_all_subscribers(tmp_path: Path) -> None:
+    log_path = tmp_path / "latest.log"
+    broadcaster = LogBroadcaster(
+        lambda: log_path, rotation_check_seconds=0.05
+    )
+
+    first = broadcaster.subscribe()
+    second = broadcaster.subscribe()
+    try:
+        # Give the tail thread a moment to open the file and seek to its end.
+        time.sleep(0.2)
+        with log_path.open("a", encoding="utf-8") as handle:
+            handle.write("hello\n")
+
+        assert first.get(timeout=5.0) == ["hello\n"]
+        assert second.get(timeout=5.0) == ["hello\n"]
+    finally:
+        broadcaster.unsubscribe(first)
+        broadcaster.unsubscribe(second)
+
+
+def test_log_broadcaster_follows_rotation(tmp_path: Path) -> None:
+    paths = {"current": tmp_path / "run-1.log"}
+    broadcaster = LogBroadcaster(
+        lambda: paths["current"], rotation_check_seconds=0.05
+    )
+
+    subscription = broadcaster.subscribe()
+    try:
+        time.sleep(0.2)
+        paths["current"] = tmp_path / "run-2.log"
+        # Let the broadcaster notice the new path before it is written.
+        time.sleep(0.3)
+        with paths["current"].open("a", encoding="utf-8") as handle:
+            handle.write("rotated\n")
+
+        assert subscription.get(timeout=5.0) == ["rotated\n"]
+    finally:
+        broadcaster.unsubscribe(subscription)
+
+
+def test_log_broadcaster_publishes_available_lines_as_one_batch(
+    tmp_path: Path,
+) -> None:
+    log_path = tmp_path / "latest.log"
+    broadcaster = LogBroadcaster(lambda: log_path, rotation_check_seconds=0.05)
+
+    subscription = broadcaster.subscribe()
+    try:
+        time.sleep(0.2)
+        with log_path.open("a", encoding="utf-8") as handle:
+            handle.write("one\ntwo\nthree\n")
+
+        assert subscription.get(timeout=5.0) == ["one\n", "two\n", "three\n"]
+    finally:
+        broadcaster.unsubscribe(subscription)
+
+
+def test_log_broadcaster_switches_logs_on_directory_event(tmp_path: Path) -> None:
+    first_log = tmp_path / "run-1.log"
+    first_log.touch()
+    paths = {"current": first_log}
+    broadcaster = LogBroadcaster(lambda: paths["current"], rotation_check_seconds=30.0)
+
+    with LogWatcher(first_log) as probe:
+        if not probe.uses_inotify:
+            pytest.skip("inotify is not available on this platform")
+
+    subscription = broadcaster.subscribe()
+    try:
+        time.sleep(0.2)
+        second_log = tmp_path / "run-2.log"
+        # Mirror logging.FileHandler: the file exists before the path switches.
+        second_log.touch()
+        paths["current"] = second_log
+        with second_log.open("a", encoding="utf-8") as handle:
+            handle.write("Logging to run-2.log\n")
+
+        started = time.monotonic()
+        assert subscription.get(timeout=5.0) == ["Logging to run-2.log\n"]
+        assert time.monotonic() - started < 4.0
+    finally:
+        broadcaster.unsubscribe(subscription)
+        # Wake the tail thread so it notices there are no subscribers left.
+        with first_log.open("a", encoding="utf-8") as handle:
+            handle.write("done\n")
+
+
+def test_log_broadcaster_restarts_after_tailer_failure(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    errors: list[str] = []
+    monkeypatch.setattr(log_watch, "log_line", errors.append)
+    log_path = tmp_path / "latest.log"
+    calls = {"count": 0}
+
+    def flaky_path() -> Path:
+        calls["count"] += 1
+        if calls["count"] == 1:
+            raise PermissionError("log directory unreadable")
+        return log_path
+
+    broadcaster = LogBroadcaster(flaky_path, rotation_check_seconds=0.05)
+    failed = broadcaster.subscribe()
+    deadline = time.monotonic() + 5.0
+    while broadcaster._thread is not None and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert broadcaster._thread is None
+    assert "PermissionError" in errors[0]
+
+    subscription = broadcaster.subscribe()
+    try:
+        time.sleep(0.2)
+        with log_path.open("a", encoding="utf-8") as handle:
+            handle.write("recovered\n")
+
+        assert subscription.get(timeout=5.0) == ["recovered\n"]
+        assert failed.get(timeout=5.0) == ["recovered\n"]
+    finally:
+        broadcaster.unsubscribe(failed)
+        broadcaster.unsubscribe(subscription)
+
+
+def test_log_broadcaster_drops_oldest_batches_for_stalled_subscribers(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.setattr(log_watch, "SUBSCRIBER_BACKLOG", 2)
+    broadcaster = LogBroadcaster(
+        lambda: tmp_path / "latest.log", rotation_check_seconds=0.05
+    )
+    subscription = broadcaster.subscribe()
+    try:
+        for batch in (["one\n"], ["two\n"], ["three\n"]):
+            broadcaster._publish(batch)
+
+        assert subscription.get_nowait() == ["two\n"]
+        assert subscription.get_nowait() == ["three\n"]
+    finally:
+        broadcaster.unsubscribe(subscription)
@@ -1,4 +1,5 @@
-from app.scraper import logging_utils
+from app.scraper import config, logging_utils
+from tests.test_runs_api_db import _configure_temp_paths
 
 
 def test_scraper_event_label_and_phase(monkeypatch):
@@ -12,3 +13,20 @@ def test_scraper_event_label_and_phase(monkeypatch):
     assert line.startswith("[SCRAPER][STATE]")
     assert "phase='download_executor'" in line
     assert "kind='summary'" in line
+
+
+def test_configure_logger_flushes_queued_lines_on_switch(tmp_path, monkeypatch):
+    from app.scraper import utils
+
+    _configure_temp_paths(tmp_path, monkeypatch)
+    first = tmp_path / "run-1.log"
+    second = tmp_path / "run-2.log"
+    utils._configure_logger(first)
+    try:
+        utils.log_line("queued for run one")
+        utils._configure_logger(second)
+
+        assert "queued for run one" in first.read_text(encoding="utf-8")
+        assert "queued for run one" not in second.read_text(encoding="utf-8")
+    finally:
+        utils._configure_logger(config.LOG_FILE)
@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import csv
+import gzip
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+from tests.test_runs_api_db import _configure_temp_paths, _reload_main_module
+
+
+def _write_metadata(downloads: list[object]) -> None:
+    from app.scraper import config
+
+    config.METADATA_FILE.parent.mkdir(parents=True, exist_ok=True)
+    config.METADATA_FILE.write_text(
+        json.dumps({"downloads": downloads}), encoding="utf-8"
+    )
+
+
+def test_export_csv_writes_header_and_rows(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _configure_temp_paths(tmp_path, monkeypatch)
+    main = _reload_main_module()
+    _write_metadata(
+        [
+            {
+                "fid": "FID1",
+                "slug": "slug-1",
+                "title": "Smith v Jones, Re",
+                "court": "Grand Court",
+                "filesize": 2048,
+                "ignored": "not exported",
+            },
+            "not-a-dict",
+            {"fid": "FID2", "title": None},
+        ]
+    )
+
+    client = main.app.test_client()
+    resp = client.get("/export/csv")
+
+    assert resp.status_code == 200
+    assert resp.is_streamed
+    assert resp.mimetype == "text/csv"
+    assert "attachment; filename=metadata.csv" in resp.headers["Content-Disposition"]
+
+    rows = list(csv.reader(io.StringIO(resp.get_data(as_text=True))))
+    assert rows[0] == list(main._CSV_FIELDNAMES)
+    assert len(rows) == 3
+
+    first = dict(zip(rows[0], rows[1]))
+    assert first["fid"] == "FID1"
+    assert first["title"] == "Smith v Jones, Re"
+    assert first["court"] == "Grand Court"
+    assert first["filesize"] == "2048"
+    assert first["judgment_date"] == ""
+
+    second = dict(zip(rows[0], rows[2]))
+    assert second["fid"] == "FID2"
+    assert second["title"] == ""
+
+
+def test_api_metadata_returns_downloads(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _configure_temp_paths(tmp_path, monkeypatch)
+    main = _reload_main_module()
+    _write_metadata([{"fid": "FID1", "title": "Café v Ltd"}])
+
+    resp = main.app.test_client().get("/api/metadata")
+
+    assert resp.status_code == 200
+    assert resp.mimetype == "application/json"
+    assert resp.get_json() == {"downloads": [{"fid": "FID1", "title": "Café v Ltd"}]}
+
+
+def test_api_metadata_tolerates_corrupt_file(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _configure_temp_paths(tmp_path, monkeypatch)
+    main = _reload_main_module()
+    from app.scraper import config
+
+    config.METADATA_FILE.parent.mkdir(parents=True, exist_ok=True)
+    config.METADATA_FILE.write_text("{not json", encoding="utf-8")
+
+    resp = main.app.test_client().get("/api/metadata")
+
+    assert resp.get_json() == {"downloads": []}
+
+
+@pytest.mark.parametrize("path", ["/api/metadata", "/export/csv"])
+def test_metadata_endpoints_honour_conditional_requests(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, path: str
+) -> None:
+    _configure_temp_paths(tmp_path, monkeypatch)
+    main = _reload_main_module()
+    _write_metadata([{"fid": "FID1"}])
+
+    client = main.app.test_client()
+    first = client.get(path)
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+    assert etag.startswith('W/"')
+    assert first.headers["Last-Modified"]
+    assert first.headers["Cache-Control"] == "no-cache"
+
+    cached = client.get(path, headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.data == b""
+    assert cached.headers["ETag"] == etag
+
+    since = client.get(
+        path, headers={"If-Modified-Since": first.headers["Last-Modified"]}
+    )
+    assert since.status_code == 304
+
+    _write_metadata([{"fid": "FID1"}, {"fid": "FID2"}])
+    refreshed = client.get(path, headers={"If-None-Match": etag})
+    assert refreshed.status_code == 200
+    assert refreshed.headers["ETag"] != etag
+
+
+def test_export_csv_serves_cached_gzip_when_accepted(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _configure_temp_paths(tmp_path, monkeypatch)
+    main = _reload_main_module()
+    _write_metadata([{"fid": "FID1", "title": "Smith v Jones"}])
+
+    client = main.app.test_client()
+    plain = client.get("/export/csv").get_data()
+    resp = client.get("/export/csv", headers={"Accept-Encoding": "gzip"})
+
+    assert resp.status_code == 200
+    assert resp.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in resp.headers["Vary"]
+    assert gzip.decompress(resp.get_data()) == plain
+    assert len(main._GZIP_METADATA_CACHE) == 1
+
+    again = client.get("/api/metadata", headers={"Accept-Encoding": "gzip"})
+    assert json.loads(gzip.decompress(again.get_data())) == {
+        "downloads": [{"fid": "FID1", "title": "Smith v Jones"}]
+    }
+    assert len(main._GZIP_METADATA_CACHE) == 2
+
+
+def test_export_csv_serves_prerendered_file_while_fresh(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _configure_temp_paths(tmp_path, monkeypatch)
+    main = _reload_main_module()
+    _write_metadata([{"fid": "FID1", "title": "Smith v Jones"}])
+
+    client = main.app.test_client()
+    streamed = client.get("/export/csv").get_data()
+
+    main._refresh_metadata_csv()
+    rendered = main._metadata_csv_path()
+    assert rendered.read_bytes() == streamed
+
+    def _fail(meta: dict) -> None:
+        raise AssertionError("fresh export should not be re-rendered")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(main, "_iter_metadata_csv", _fail)
+        resp = client.get("/export/csv")
+    assert resp.status_code == 200
+    assert resp.get_data() == streamed
+    assert resp.headers["ETag"].startswith('W/"')
+    assert "attachment; filename=metadata.csv" in resp.headers["Content-Disposition"]
+    resp.close()
+
+    _write_metadata([{"fid": "FID1"}, {"fid": "FID2"}])
+    stale = client.get("/export/csv")
+    assert stale.is_streamed
+    assert len(list(csv.reader(io.StringIO(stale.get_data(as_text=True))))) == 3
+
+
+def test_iter_metadata_csv_groups_rows_into_chunks(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _configure_temp_paths(tmp_path, monkeypatch)
+    main = _reload_main_module()
+    monkeypatch.setattr(main, "_CSV_CHUNK_CHARS", 40)
+    meta = {"downloads": [{"fid": f"FID{i}", "title": "x" * 10} for i in range(5)]}
+
+    chunks = list(main._iter_metadata_csv(meta))
+
+    assert chunks[0] == ",".join(main._CSV_FIELDNAMES) + "\r\n"
+    assert 1 < len(chunks) - 1 < 5
+    rows = list(csv.reader(io.StringIO("".join(chunks))))
+    assert [row[0] for row in rows[1:]] == [f"FID{i}" for i in range(5)]
+
+
+def test_metadata_is_parsed_once_per_file_state(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _configure_temp_paths(tmp_path, monkeypatch)
+    main = _reload_main_module()
+    _write_metadata([{"fid": "FID1"}])
+
+    loads = []
+    original_load = main.load_metadata
+
+    def counting_load() -> dict:
+        loads.append(1)
+        return original_load()
+
+    monkeypatch.setattr(main, "load_metadata", counting_load)
+    client = main.app.test_client()
+
+    first = client.get("/api/metadata").get_data()
+    assert client.get("/api/metadata").get_data() == first
+    client.get("/export/csv").get_data()
+    assert len(loads) == 1
+
+    _write_metadata([{"fid": "FID1"}, {"fid": "FID2"}])
+    assert len(client.get("/api/metadata").get_json()["downloads"]) == 2
+    assert len(loads) == 2
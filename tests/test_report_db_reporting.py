@@ -198,3 +198,140 @@ def test_report_renders_in_both_reporting_modes(
 
     assert "/api/downloaded-cases" in html_legacy
     assert "/api/downloaded-cases" in html_db
+
+
+@pytest.mark.parametrize("use_db", ["0", "1"])
+@pytest.mark.parametrize("path", ["/api/downloaded-cases", "/report"])
+def test_report_endpoints_answer_304_until_data_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, use_db: str, path: str
+) -> None:
+    _configure_temp_paths(tmp_path, monkeypatch)
+    db.initialize_schema()
+
+    csv_version_id = db.record_csv_version(
+        fetched_at="2024-03-01T00:00:00Z",
+        source_url="http://example.com/csv",
+        sha256="abc123",
+        row_count=1,
+        file_path="judgments.csv",
+    )
+    _seed_db_with_download(csv_version_id)
+    _seed_json_downloads(config.DOWNLOADS_LOG)
+
+    monkeypatch.setenv("BAILIIKC_USE_DB_REPORTING", use_db)
+    main = _reload_main_module()
+    client = main.app.test_client()
+
+    first = client.get(path)
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+
+    cached = client.get(path, headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.headers["ETag"] == etag
+
+    if use_db == "1":
+        _seed_db_with_download(csv_version_id)
+    else:
+        with config.DOWNLOADS_LOG.open("a", encoding="utf-8") as handle:
+            handle.write('{"actions_token": "TOK-TWO", "title": "Second"}\n')
+
+    refreshed = client.get(path, headers={"If-None-Match": etag})
+    assert refreshed.status_code == 200
+    assert refreshed.headers["ETag"] != etag
+
+
+def test_report_renders_pending_flashes_despite_matching_etag(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _configure_temp_paths(tmp_path, monkeypatch)
+    db.initialize_schema()
+    monkeypatch.setenv("BAILIIKC_USE_DB_REPORTING", "0")
+    main = _reload_main_module()
+    client = main.app.test_client()
+
+    etag = client.get("/report").headers["ETag"]
+    with client.session_transaction() as flask_session:
+        flask_session["_flashes"] = [("info", "Download state reset.")]
+
+    resp = client.get("/report", headers={"If-None-Match": etag})
+
+    assert resp.status_code == 200
+    assert "Download state reset." in resp.get_data(as_text=True)
+
+
+def test_downloaded_cases_body_is_cached_per_data_version(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _configure_temp_paths(tmp_path, monkeypatch)
+    db.initialize_schema()
+    csv_version_id = db.record_csv_version(
+        fetched_at="2024-03-01T00:00:00Z",
+        source_url="http://example.com/csv",
+        sha256="abc123",
+        row_count=1,
+        file_path="judgments.csv",
+    )
+    _seed_db_with_download(csv_version_id)
+
+    monkeypatch.setenv("BAILIIKC_USE_DB_REPORTING", "1")
+    main = _reload_main_module()
+    client = main.app.test_client()
+
+    calls = []
+    original = main._get_download_rows_for_ui
+
+    def counting_rows(source=None):
+        calls.append(source)
+        return original(source=source)
+
+    monkeypatch.setattr(main, "_get_download_rows_for_ui", counting_rows)
+
+    first = client.get("/api/downloaded-cases")
+    second = client.get("/api/downloaded-cases")
+    assert first.get_data() == second.get_data()
+    assert len(first.get_json()["data"]) == 1
+    assert len(calls) == 1
+
+    _seed_db_with_download(csv_version_id)
+    third = client.get("/api/downloaded-cases")
+    assert len(calls) == 2
+    assert len(main._DOWNLOADED_CASES_CACHE) == 1
+    assert third.status_code == 200
+
+
+def test_report_facets_are_cached_per_data_version(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _configure_temp_paths(tmp_path, monkeypatch)
+    db.initialize_schema()
+    csv_version_id = db.record_csv_version(
+        fetched_at="2024-03-01T00:00:00Z",
+        source_url="http://example.com/csv",
+        sha256="abc123",
+        row_count=1,
+        file_path="judgments.csv",
+    )
+    _seed_db_with_download(csv_version_id)
+
+    monkeypatch.setenv("BAILIIKC_USE_DB_REPORTING", "1")
+    main = _reload_main_module()
+    client = main.app.test_client()
+
+    calls = []
+    original = main.db_reporting.get_download_facets_for_run
+
+    def counting_facets(*args, **kwargs):
+        calls.append(kwargs)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(main.db_reporting, "get_download_facets_for_run", counting_facets)
+
+    assert client.get("/report").status_code == 200
+    assert client.get("/report").status_code == 200
+    assert len(calls) == 1
+
+    _seed_db_with_download(csv_version_id)
+    assert client.get("/report").status_code == 200
+    assert len(calls) == 2
+    assert len(main._REPORT_FACETS_CACHE) == 1
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from tests.test_runs_api_db import _configure_temp_paths, _reload_main_module
+
+
+def test_read_last_log_lines_returns_tail_and_caches(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _configure_temp_paths(tmp_path, monkeypatch)
+    main = _reload_main_module()
+
+    log_path = tmp_path / "tail.log"
+    log_path.write_text("".join(f"line {i}\n" for i in range(500)), encoding="utf-8")
+    monkeypatch.setattr(main, "get_current_log_path", lambda: log_path)
+
+    lines = main._read_last_log_lines(limit=3)
+    assert lines == ["line 497", "line 498", "line 499"]
+    assert len(main._LOG_TAIL_CACHE) == 1
+
+    with log_path.open("a", encoding="utf-8") as handle:
+        handle.write("line 500\n")
+    assert main._read_last_log_lines(limit=3) == ["line 498", "line 499", "line 500"]
+
+
+@pytest.mark.parametrize("block_bytes", [7, 16, 8 * 1024])
+def test_read_last_log_lines_reads_backwards_across_blocks(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, block_bytes: int
+) -> None:
+    _configure_temp_paths(tmp_path, monkeypatch)
+    main = _reload_main_module()
+
+    log_path = tmp_path / "tail.log"
+    log_path.write_text(
+        "x" * 100 + "\nfirst\n" + "y" * 40 + "\nlast", encoding="utf-8"
+    )
+    monkeypatch.setattr(main, "get_current_log_path", lambda: log_path)
+    monkeypatch.setattr(main, "_LOG_TAIL_BLOCK_BYTES", block_bytes)
+
+    assert main._read_last_log_lines(limit=3) == ["first", "y" * 40, "last"]
+
+
+def test_read_last_log_lines_handles_short_and_empty_logs(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _configure_temp_paths(tmp_path, monkeypatch)
+    main = _reload_main_module()
+
+    log_path = tmp_path / "tail.log"
+    log_path.write_text("", encoding="utf-8")
+    monkeypatch.setattr(main, "get_current_log_path", lambda: log_path)
+    assert main._read_last_log_lines(limit=5) == []
+
+    log_path.write_text("only\r\n", encoding="utf-8")
+    assert main._read_last_log_lines(limit=5) == ["only"]
+
+
+def test_sse_events_group_lines_into_capped_messages(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _configure_temp_paths(tmp_path, monkeypatch)
+    main = _reload_main_module()
+    monkeypatch.setattr(main, "_SSE_MAX_LINES_PER_EVENT", 2)
+
+    payload = main._sse_events(["one\n", "two\r\n", "three\n"])
+
+    assert payload == "data: one\ndata: two\n\ndata: three\n\n"
@@ -50,6 +50,37 @@ def test_get_download_rows_for_ui_json_fallback(
     assert rows[0]["size_kb"] == pytest.approx(0.5)
 
 
+def test_json_report_view_is_cached_until_log_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _configure_temp_paths(tmp_path, monkeypatch)
+    monkeypatch.setenv("BAILIIKC_USE_DB_REPORTING", "0")
+
+    downloads_log = config.DOWNLOADS_LOG
+    downloads_log.parent.mkdir(parents=True, exist_ok=True)
+    downloads_log.write_text(
+        '{"actions_token": "a", "saved_path": "pdfs/a.pdf", "court": "Grand", "category": "Civil"}\n',
+        encoding="utf-8",
+    )
+
+    main = _reload_main_module()
+
+    first = main._json_report_view()
+    assert main._json_report_view() is first
+    assert first[1] == ["Grand"]
+    assert first[2] == ["Civil"]
+
+    with downloads_log.open("a", encoding="utf-8") as handle:
+        handle.write(
+            '{"actions_token": "b", "saved_path": "pdfs/b.pdf", "court": "Appeal", "category": "Civil"}\n'
+        )
+
+    refreshed = main._json_report_view()
+    assert [row["actions_token"] for row in refreshed[0]] == ["a", "b"]
+    assert refreshed[1] == ["Appeal", "Grand"]
+    assert refreshed[2] == ["Civil"]
+
+
 def test_get_download_rows_for_ui_db_enabled(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
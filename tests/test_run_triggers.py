@@ -1,5 +1,7 @@
+import gzip
 import importlib
 import sys
+import threading
 from pathlib import Path
 from typing import Any, Dict
 
@@ -33,17 +35,6 @@ def _reload_main_module():
     return importlib.import_module("app.main")
 
 
-class _DummyThread:
-    """Thread stub that runs the target synchronously in tests."""
-
-    def __init__(self, target, daemon: bool = True):
-        self._target = target
-        self.daemon = daemon
-
-    def start(self) -> None:
-        self._target()
-
-
 def test_ui_scrape_uses_ui_trigger(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     _configure_temp_paths(tmp_path, monkeypatch)
     db.initialize_schema()
@@ -58,7 +49,6 @@ def test_ui_scrape_uses_ui_trigger(tmp_path: Path, monkeypatch: pytest.MonkeyPat
         return {"log_file": "dummy.log", "run_id": 1}
 
     monkeypatch.setattr(main, "run_scrape", fake_run_scrape)
-    monkeypatch.setattr(main.threading, "Thread", _DummyThread)
 
     client = main.app.test_client()
     resp = client.post(
@@ -77,6 +67,7 @@ def test_ui_scrape_uses_ui_trigger(tmp_path: Path, monkeypatch: pytest.MonkeyPat
     assert resp.status_code == 302
     assert "Location" in resp.headers
 
+    main._SCRAPE_FUTURE.result(timeout=5)
     assert "kwargs" in calls
     assert calls["kwargs"]["trigger"] == "ui"
     assert calls["kwargs"].get("target_source") == config.DEFAULT_SOURCE
@@ -119,3 +110,180 @@ def test_webhook_uses_webhook_trigger(tmp_path: Path, monkeypatch: pytest.Monkey
     assert kwargs["row_limit"] == 5
     assert kwargs["limit_pages"] == [0]
     assert kwargs["target_source"] == sources.UNREPORTED_JUDGMENTS
+
+
+def test_ui_scrape_rejects_concurrent_submission(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _configure_temp_paths(tmp_path, monkeypatch)
+    db.initialize_schema()
+
+    main = _reload_main_module()
+
+    started = threading.Event()
+    release = threading.Event()
+    calls: list[Dict[str, Any]] = []
+
+    def fake_run_scrape(*args, **kwargs):
+        calls.append(kwargs)
+        started.set()
+        release.wait(timeout=5)
+        return {"log_file": "dummy.log", "run_id": 1}
+
+    monkeypatch.setattr(main, "run_scrape", fake_run_scrape)
+
+    client = main.app.test_client()
+    form = {"base_url": "https://example.com", "scrape_mode": "new"}
+    try:
+        assert client.post("/scrape", data=form).status_code == 302
+        assert started.wait(timeout=5)
+
+        resp = client.post("/scrape", data=form, follow_redirects=True)
+        assert b"already running" in resp.data
+    finally:
+        release.set()
+        main._SCRAPE_FUTURE.result(timeout=5)
+
+    assert len(calls) == 1
+
+
+def test_ui_resume_is_rejected_while_scrape_runs(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _configure_temp_paths(tmp_path, monkeypatch)
+    db.initialize_schema()
+
+    main = _reload_main_module()
+
+    started = threading.Event()
+    release = threading.Event()
+    calls: list[Dict[str, Any]] = []
+
+    def fake_run_scrape(*args, **kwargs):
+        calls.append(kwargs)
+        started.set()
+        release.wait(timeout=5)
+        return {"log_file": "dummy.log", "run_id": 1}
+
+    monkeypatch.setattr(main, "run_scrape", fake_run_scrape)
+
+    client = main.app.test_client()
+    try:
+        resp = client.post("/scrape", data={"base_url": "https://example.com"})
+        assert resp.status_code == 302
+        assert started.wait(timeout=5)
+
+        resp = client.post("/resume", data={"resume_mode": "auto"}, follow_redirects=True)
+        assert b"already running" in resp.data
+    finally:
+        release.set()
+        main._SCRAPE_FUTURE.result(timeout=5)
+
+    assert [call["resume"] for call in calls] == [config.SCRAPE_RESUME_DEFAULT]
+
+    resp = client.post("/resume", data={"resume_mode": "auto"})
+    assert resp.status_code == 302
+    main._SCRAPE_FUTURE.result(timeout=5)
+    assert calls[-1]["resume"] is True
+
+
+def test_index_prefills_form_from_last_params(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _configure_temp_paths(tmp_path, monkeypatch)
+    db.initialize_schema()
+    monkeypatch.setattr(config, "SCRAPE_NEW_LIMIT", 17)
+    main = _reload_main_module()
+    main.app.config["LAST_PARAMS"] = {"page_wait": 42, "resume_mode": "logs"}
+
+    html = main.app.test_client().get("/").get_data(as_text=True)
+
+    assert 'name="page_wait" min="1" value="42"' in html
+    assert 'name="new_limit" min="0" value="17"' in html
+    assert 'value="logs" checked' in html
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [("12", 12), (" -3 ", -3), ("+4", 4), ("", 7), ("abc", 7), ("1.5", 7), ("²", 7)],
+)
+def test_form_int_falls_back_to_default(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, raw: str, expected: int
+) -> None:
+    _configure_temp_paths(tmp_path, monkeypatch)
+    main = _reload_main_module()
+
+    with main.app.test_request_context(method="POST", data={"value": raw}):
+        assert main._form_int("value", 7) == expected
+        assert main._form_int("missing", None) is None
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"), [("0.25", 0.25), ("2", 2.0), ("", 1.5), ("nan", 1.5), ("x", 1.5)]
+)
+def test_form_float_falls_back_to_default(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, raw: str, expected: float
+) -> None:
+    _configure_temp_paths(tmp_path, monkeypatch)
+    main = _reload_main_module()
+
+    with main.app.test_request_context(method="POST", data={"value": raw}):
+        assert main._form_float("value", 1.5) == expected
+
+
+def test_index_reuses_rendered_page_until_params_change(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _configure_temp_paths(tmp_path, monkeypatch)
+    db.initialize_schema()
+    main = _reload_main_module()
+    client = main.app.test_client()
+
+    renders = []
+    original_render = main.render_template
+
+    def counting_render(*args: Any, **kwargs: Any) -> str:
+        renders.append(args[0])
+        return original_render(*args, **kwargs)
+
+    monkeypatch.setattr(main, "render_template", counting_render)
+
+    first = client.get("/")
+    assert client.get("/").get_data() == first.get_data()
+    assert renders == ["index.html"]
+
+    cached = client.get("/", headers={"If-None-Match": first.headers["ETag"]})
+    assert cached.status_code == 304
+
+    main.app.config["LAST_PARAMS"] = {"page_wait": 99}
+    changed = client.get("/", headers={"If-None-Match": first.headers["ETag"]})
+    assert changed.status_code == 200
+    assert 'value="99"' in changed.get_data(as_text=True)
+
+    with client.session_transaction() as flask_session:
+        flask_session["_flashes"] = [("info", "Download state reset.")]
+    flashed = client.get("/", headers={"If-None-Match": changed.headers["ETag"]})
+    assert flashed.status_code == 200
+    assert "Download state reset." in flashed.get_data(as_text=True)
+
+
+def test_index_page_is_gzipped_for_accepting_clients(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _configure_temp_paths(tmp_path, monkeypatch)
+    db.initialize_schema()
+    main = _reload_main_module()
+    client = main.app.test_client()
+
+    plain = client.get("/")
+    encoded = client.get("/", headers={"Accept-Encoding": "gzip"})
+
+    assert encoded.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in encoded.headers["Vary"]
+    assert gzip.decompress(encoded.get_data()) == plain.get_data()
+
+    cached = client.get(
+        "/",
+        headers={"Accept-Encoding": "gzip", "If-None-Match": encoded.headers["ETag"]},
+    )
+    assert cached.status_code == 304
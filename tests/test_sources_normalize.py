@@ -10,3 +10,10 @@ def test_normalize_source_defaults_and_aliases() -> None:
     assert sources.normalize_source("public-registers") == sources.PUBLIC_REGISTERS
     assert sources.normalize_source("pr") == sources.PUBLIC_REGISTERS
     assert sources.normalize_source("unknown") == sources.UNREPORTED_JUDGMENTS
+
+
+def test_coerce_source_maps_every_alias_case_insensitively() -> None:
+    for alias, canonical in sources._SOURCE_ALIASES.items():
+        assert sources.coerce_source(f" {alias.upper()} ") == canonical
+    assert sources.coerce_source("nonsense") == sources.DEFAULT_SOURCE
+    assert sources.coerce_source(None) == sources.DEFAULT_SOURCE
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from tests.test_runs_api_db import _configure_temp_paths
+
+
+def test_build_zip_reuses_archive_until_pdfs_change(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _configure_temp_paths(tmp_path, monkeypatch)
+    from app.scraper import config, utils
+
+    config.PDF_DIR.mkdir(parents=True, exist_ok=True)
+    (config.PDF_DIR / "one.pdf").write_bytes(b"%PDF-1")
+
+    archive = utils.build_zip()
+    first_mtime = archive.stat().st_mtime_ns
+    assert utils.build_zip().stat().st_mtime_ns == first_mtime
+
+    (config.PDF_DIR / "two.pdf").write_bytes(b"%PDF-2")
+    rebuilt = utils.build_zip()
+    with zipfile.ZipFile(rebuilt) as bundle:
+        assert sorted(bundle.namelist()) == ["one.pdf", "two.pdf"]
+
+
+def test_build_zip_appends_new_pdfs_and_rebuilds_on_removal(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _configure_temp_paths(tmp_path, monkeypatch)
+    from app.scraper import config, utils
+
+    config.PDF_DIR.mkdir(parents=True, exist_ok=True)
+    (config.PDF_DIR / "one.pdf").write_bytes(b"%PDF-1")
+    utils.build_zip()
+
+    (config.PDF_DIR / "two.pdf").write_bytes(b"%PDF-2")
+    written = []
+    original_write = zipfile.ZipFile.write
+
+    def recording_write(self, filename, arcname=None, *args, **kwargs):
+        written.append(arcname)
+        return original_write(self, filename, arcname, *args, **kwargs)
+
+    monkeypatch.setattr(zipfile.ZipFile, "write", recording_write)
+    archive = utils.build_zip()
+    assert written == ["two.pdf"]
+    with zipfile.ZipFile(archive) as bundle:
+        assert sorted(bundle.namelist()) == ["one.pdf", "two.pdf"]
+        assert {info.compress_type for info in bundle.infolist()} == {
+            zipfile.ZIP_STORED
+        }
+        assert bundle.read("one.pdf") == b"%PDF-1"
+
+    (config.PDF_DIR / "one.pdf").unlink()
+    written.clear()
+    with zipfile.ZipFile(utils.build_zip()) as bundle:
+        assert bundle.namelist() == ["two.pdf"]
+    assert written == ["two.pdf"]
+
+
+def test_ensure_dirs_only_touches_disk_once_until_reset(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _configure_temp_paths(tmp_path, monkeypatch)
+    from app.scraper import config, utils
+
+    utils.ensure_dirs()
+    config.SUMMARY_FILE.unlink()
+    utils.ensure_dirs()
+    assert not config.SUMMARY_FILE.exists()
+
+    utils.reset_state()
+    assert config.SUMMARY_FILE.exists()
+    assert config.METADATA_FILE.exists()
+
+
+def test_list_pdfs_and_has_local_pdf_skip_non_files(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _configure_temp_paths(tmp_path, monkeypatch)
+    from app.scraper import config, utils
+
+    config.PDF_DIR.mkdir(parents=True, exist_ok=True)
+    (config.PDF_DIR / "b.pdf").write_bytes(b"%PDF" + b"0" * 2048)
+    (config.PDF_DIR / "a.pdf").write_bytes(b"%PDF")
+    (config.PDF_DIR / "notes.txt").write_text("x")
+    (config.PDF_DIR / "folder.pdf").mkdir()
+
+    assert [p.name for p in utils.list_pdfs()] == ["a.pdf", "b.pdf"]
+    assert utils.has_local_pdf({"local_filename": "b.pdf"}) is True
+    assert utils.has_local_pdf({"local_filename": "a.pdf"}) is False
+    assert utils.has_local_pdf({"local_filename": "folder.pdf"}) is False
+    assert utils.has_local_pdf({"local_filename": "missing.pdf"}) is False
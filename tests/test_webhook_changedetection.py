@@ -159,3 +159,84 @@ def test_webhook_clamps_limit(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -
     assert calls["kwargs"]["new_limit"] == main.WEBHOOK_LIMIT_MAX
     assert calls["kwargs"]["row_limit"] == main.WEBHOOK_LIMIT_MAX
     assert calls["kwargs"]["target_source"] == sources.UNREPORTED_JUDGMENTS
+
+
+def test_webhook_returns_409_while_scrape_running(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    _configure_temp_paths(tmp_path, monkeypatch)
+    monkeypatch.setattr(config, "WEBHOOK_SHARED_SECRET", "secret-token")
+    db.initialize_schema()
+
+    main = _reload_main_module()
+    calls = []
+
+    def fake_run_scrape(**kwargs):
+        calls.append(kwargs)
+        # A second delivery arriving mid-run must be turned away.
+        nested = main.app.test_client().post(
+            "/webhook/changedetection",
+            json={"mode": "new"},
+            headers={"X-Webhook-Token": "secret-token"},
+        )
+        assert nested.status_code == 409
+        assert nested.get_json()["error"] == "scrape_in_progress"
+        return {"log_file": "dummy.log", "run_id": 1}
+
+    monkeypatch.setattr(main, "run_scrape", fake_run_scrape)
+
+    client = main.app.test_client()
+    resp = client.post(
+        "/webhook/changedetection",
+        json={"mode": "new"},
+        headers={"X-Webhook-Token": "secret-token"},
+    )
+
+    assert resp.status_code == 200
+    assert len(calls) == 1
+    assert main._scrape_in_progress() is False
+
+
+@pytest.mark.parametrize("token", ["", "secret-tokeN", "sécret-token"])
+def test_webhook_rejects_near_miss_tokens(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, token: str
+) -> None:
+    _configure_temp_paths(tmp_path, monkeypatch)
+    monkeypatch.setattr(config, "WEBHOOK_SHARED_SECRET", "secret-token")
+
+    main = _reload_main_module()
+
+    resp = main.app.test_client().post(
+        "/webhook/changedetection", query_string={"token": token}
+    )
+
+    assert resp.status_code == 403
+    assert resp.get_json()["error"] == "invalid_token"
+
+
+@pytest.mark.parametrize("body", [b"", b"{not json", b"[1, 2]"])
+def test_webhook_ignores_unusable_json_bodies(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, body: bytes
+) -> None:
+    _configure_temp_paths(tmp_path, monkeypatch)
+    monkeypatch.setattr(config, "WEBHOOK_SHARED_SECRET", "secret-token")
+
+    main = _reload_main_module()
+
+    calls: dict[str, object] = {}
+
+    def fake_run_scrape(*args, **kwargs):
+        calls["kwargs"] = kwargs
+        return {"run_id": 1}
+
+    monkeypatch.setattr(main, "run_scrape", fake_run_scrape)
+
+    resp = main.app.test_client().post(
+        "/webhook/changedetection?new_limit=2&mode=new",
+        data=body,
+        content_type="application/json",
+        headers={"X-Webhook-Token": "secret-token"},
+    )
+
+    assert resp.status_code == 200
+    assert calls["kwargs"]["new_limit"] == 2